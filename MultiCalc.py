@@ -7,7 +7,12 @@ import numpy as np
 
 
 # Import local *.py files as reference modules to be utilized in the calculation
-import formulas  # formulas.py: Revise as necessary for your numerical calculations.
+import registry  # registry.py: Index of the calc classes. Only the module of the selected calc is imported.
+import sweep  # sweep.py: Runs many cases of the selected beam, streaming results to the page.
+import elastica  # elastica.py: Large deflection of the selected beam, for long and flexible members.
+import session  # session.py: Results kept by each session between reruns, within a memory budget.
+import compare  # compare.py: Pinned cases overlaid side by side, with their governing values ranked.
+import shapes  # shapes.py: Tabulated result shapes, for results that follow sliders without a full evaluation.
 
 
 # -----------------------------------------------------------------------------------------------------------
@@ -23,29 +28,25 @@ def run():
     col1, col2, col3 = st.columns([1, 10, 20])
     
     # Present a selection to the user to define which calculation should be considered.
+    # The options come from the registry index, so no calc module is imported until one is chosen.
     selection = col2.selectbox(
         label='Beam Types',
-        options=['Cantilever, End Loaded', 'Cantilever, Intermediate Loaded', 'Cantilever, Uniform Distributed Load'],
+        options=registry.names(),
         placeholder='Select a Beam and Loading type',
         index=None
     )
-    match selection:
-        # We are calling the 'CantileverEndLoad' or 'CantileverIntermediateLoad' class object, depending on the selection, which is defined within the 'formulas.py' module
-        # By creating a class, we then are able to directly request from it standard items.
-        # This makes managing the formulas easier.
-        # The inputs to the class can be seen and matched up with the '__init__' definition within
-        # the class within formulas.py
-        case 'Cantilever, End Loaded':
-            beam = formulas.CantileverEndLoad()
-        case 'Cantilever, Intermediate Loaded':
-            beam = formulas.CantileverIntermediateLoad()
-        case 'Cantilever, Uniform Distributed Load':
-            beam = formulas.CantileverUniformDistributedLoad()
-        case _: # If the selection does not match anything previously, then...
-            st.warning('Please choose a Beam and Loading type from the drop down menu!')
-            # Since no selection was made, we do not want to continue to process any further code.
-            # We can utilize the stop command within streamlit to no longer render any additional text.
-            st.stop()
+    if selection is None:
+        st.warning('Please choose a Beam and Loading type from the drop down menu!')
+        # Since no selection was made, we do not want to continue to process any further code.
+        # We can utilize the stop command within streamlit to no longer render any additional text.
+        st.stop()
+
+    # We are calling the class object registered under the selection, such as 'CantileverEndLoad', which is defined within the 'formulas.py' module
+    # By creating a class, we then are able to directly request from it standard items.
+    # This makes managing the formulas easier.
+    # The inputs to the class can be seen and matched up with the '__init__' definition within
+    # the class within formulas.py
+    beam = registry.load(selection)()
 
     # Section Header for Results
     st.markdown('### Results')
@@ -59,13 +60,36 @@ def run():
     st.markdown('---')
 
     # By accessing the functions within whichever class module was assigned to 'beam', we can standardize the output results.
-    beam.plotDeflection()
+    # 'plotAll()' shows every result in one chart of linked panels. The single results are still
+    # available through 'plotDeflection()', 'plotShear()' and 'plotMoment()'.
+    # The results of each case are kept in the session, so returning to a case does not recompute it
+    results = session.remember(beam)
+    beam.plotAll(results)
+
+    # The formulas above assume small deflections. The large deflection solve shows how far off they are.
+    st.markdown('---')
+    with st.expander('Large Deflection'):
+        elastica.section(beam)
+
+    # The sliders rerun only their own panel, with results scaled from shapes tabulated once per calc.
+    st.markdown('---')
+    with st.expander('Live Sliders'):
+        shapes.live(beam)
+
+    # A sweep evaluates the selected beam over a range of one of its inputs.
+    # Results are computed in the background and shown as each chunk of cases completes.
+    st.markdown('---')
+    sweep.section(beam)
 
+    # Pinned cases are overlaid for comparison, each evaluated once when it is pinned
     st.markdown('---')
-    beam.plotShear()
+    with st.expander('Compare Cases'):
+        compare.section(beam, results)
 
+    # How much memory this session holds on to between reruns
     st.markdown('---')
-    beam.plotMoment()
+    with st.expander('Session Memory'):
+        session.panel()
 # -----------------------------------------------------------------------------------------------------------
 # -----------------------------------------------------------------------------------------------------------
 
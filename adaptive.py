@@ -0,0 +1,50 @@
+import numpy as np
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+
+
+def sample(equations: dict, values: dict, breakpoints: list = (), tol: float = 1e-3,
+           initial: int = 9, max_points: int = 400) -> units.ureg.Quantity:
+    """Returns x values along the beam, placed where the results need them.
+
+    equations = dict of kernels.Formula (a calc class 'equations')
+    values = dict of quantities for the formula inputs, including the length L
+    breakpoints = positions where a result jumps or kinks (a point load at 'a').
+    Each breakpoint is sampled on both sides, so a jump in shear is drawn as a vertical step.
+    Starting from a coarse grid, an interval is split only while the midpoint of any result
+    differs from the straight line between its ends by more than 'tol' times that result's range.
+    Plots and maxima then reach the tolerance with far fewer points than a fixed grid.
+    """
+    L = values['L'].to_base_units().magnitude
+    x = np.linspace(0, L, initial)
+    for b in breakpoints:
+        b = b.to_base_units().magnitude
+        if 0 < b < L:
+            x = np.concatenate([x, [b, b + 1e-9 * L]])
+    x = np.unique(x)
+    y = _evaluate(equations, values, x)
+
+    while len(x) < max_points:
+        mid = (x[:-1] + x[1:]) / 2
+        # Intervals across a breakpoint are left as a step
+        split = np.diff(x) > 1e-6 * L
+        ym = _evaluate(equations, values, mid)
+        scale = np.ptp(y, axis=1, keepdims=True)
+        scale[scale == 0] = 1
+        error = np.max(np.abs(ym - (y[:, :-1] + y[:, 1:]) / 2) / scale, axis=0)
+        refine = split & (error > tol)
+        if not refine.any():
+            break
+        # Within the point budget, refine the worst intervals first
+        budget = max_points - len(x)
+        if refine.sum() > budget:
+            refine &= error >= np.sort(error[refine])[-budget]
+        x = np.concatenate([x, mid[refine]])
+        y = np.concatenate([y, ym[:, refine]], axis=1)
+        order = np.argsort(x)
+        x, y = x[order], y[:, order]
+    return units.ureg.Quantity(x, 'm')
+
+
+def _evaluate(equations, values, x):
+    """Returns each result at x, as rows of base SI magnitudes."""
+    return np.array([eq(x=x, **values).to_base_units().magnitude for eq in equations.values()])
@@ -0,0 +1,112 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+import session  # session.py: Results kept by each session between reruns, within a memory budget.
+from plot import plotOverlay  # plot.py: No changes to plot.py will be accepted, unless use case is fully justified.
+
+
+# Cases pinned for a side by side comparison, such as other positions 'a', sections or load types.
+# A case is evaluated once, when it is pinned, and kept as compact arrays: each result resampled
+# onto a common grid of positions along the beam (x/L), so cases of different lengths line up,
+# and its governing values taken from the full curves. Drawing the comparison reuses those arrays,
+# so pinning another case never reruns the cases already pinned. Pins are kept in the session's
+# results cache, so they count against its memory budget like every other result it keeps.
+GRID = np.linspace(0, 1, 101)
+
+# Results compared, as on the page: (result, title), each shown in the units its calc class declares (see minor)
+RESULTS = (
+    ('deflection', 'Deflection'),
+    ('slope', 'Slope'),
+    ('shear', 'Shear'),
+    ('moment', 'Moment'),
+)
+
+
+# Cache keys of pinned cases are (PIN, case key), apart from the results of the page
+PIN = '_pinned'
+
+
+def pinned() -> dict:
+    """Returns the cases pinned in the current session, keyed by case (see session.key)."""
+    return {key[1]: case for key, case in session.cache().items() if type(key) is tuple and key[0] == PIN}
+
+
+def label(beam) -> str:
+    """Returns the name of a case, its calc and inputs as displayed."""
+    inputs = ', '.join(f'{name} = {units.unitdisplay(val)}' for name, val in beam.inputs().items())
+    return f"{beam.meta['name']}: {inputs}"
+
+
+def compact(results: dict) -> dict:
+    """Returns the compact form of one case's results, as kept for the comparison.
+
+    results = dict of x and each result, as returned by session.remember
+    'curves' holds each result as base SI magnitudes sampled at GRID, with its base units in 'units'.
+    """
+    x = results['x'].to_base_units().magnitude
+    curves, _units, governing = {}, {}, {}
+    for name, _ in RESULTS:
+        y = results[name].to_base_units()
+        curves[name] = np.interp(GRID, x / x[-1], y.magnitude)
+        _units[name] = str(y.units)
+        # Governing values come from the full curves, so resampling never hides a peak
+        governing[name] = kernels.governing(results[name])
+    return {'length': units.ureg.Quantity(x[-1], 'm'), 'curves': curves, 'units': _units, 'governing': governing}
+
+
+def pin(beam, results: dict | None = None):
+    """Pins the current case of 'beam', evaluating it only when its results are not passed in."""
+    if results is None:
+        results = session.remember(beam)
+    # Already compact, so a pin is kept whole until the budget forces it out
+    session.cache().put((PIN, session.key(beam)), {'label': label(beam), 'minor': dict(beam.minor), **compact(results)})
+
+
+def unpin(key: tuple):
+    session.cache().pop((PIN, key))
+
+
+def ranked(cases: list, result: str) -> pd.DataFrame:
+    """Returns the governing values of the cases, ranked by the largest magnitude of 'result'."""
+    order = sorted(cases, key=lambda case: -abs(case['governing'][result].to_base_units().magnitude))
+    return pd.DataFrame({
+        'Rank': np.arange(1, len(order) + 1),
+        'Case': [case['label'] for case in order],
+        'Length': [str(units.unitdisplay(case['length'])) for case in order],
+        **{
+            f'Maximum {title}': [str(units.unitdisplay(case['governing'][name], minor=case['minor'][name])) for case in order]
+            for name, title in RESULTS
+        },
+    })
+
+
+def section(beam, results: dict | None = None):
+    """Renders the pinned cases overlaid in one chart per result, with their governing values ranked"""
+    st.markdown('### Compare Cases')
+    cases = pinned()
+    key = session.key(beam)
+    cols = st.columns([1, 1, 4])
+    if key in cases:
+        if cols[0].button('Unpin this case'):
+            unpin(key)
+    elif cols[0].button('Pin this case'):
+        pin(beam, results)
+    if cases and cols[1].button('Clear all'):
+        for _key in cases:
+            unpin(_key)
+    cases = pinned()
+    if not cases:
+        st.caption('Pin cases to compare them here. Change the inputs or beam type, then pin again.')
+        return
+
+    rank = units.selection('Rank by', [title for _, title in RESULTS])
+    result = next(name for name, title in RESULTS if title == rank)
+    st.dataframe(ranked(list(cases.values()), result), hide_index=True)
+    for name, title in RESULTS:
+        plotOverlay(
+            f'Beam {title}', name, GRID,
+            {case['label']: units.ureg.Quantity(case['curves'][name], case['units'][name]) for case in cases.values()},
+            beam.minor[name]
+        )
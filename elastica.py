@@ -0,0 +1,126 @@
+import streamlit as st
+import numpy as np
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas, used here for the linear results.
+from plot import plot  # plot.py: No changes to plot.py will be accepted, unless use case is fully justified.
+
+
+# Large deflection (elastica) of a cantilever, fixed at the left and free to the right.
+# The loads are dead loads acting downward: a point load F at the distance 'a' along the beam
+# and a distributed load w along its length. With theta(s) the slope at the arc length s,
+# and V(s) the total load beyond s, moment equilibrium of the deformed beam gives
+#   EI * theta'(s) = M(s) = -integral from s to L of V(t)*cos(theta(t)) dt,   theta(0) = 0
+# which is linear (the small deflection formulas) only while cos(theta) is close to 1.
+
+# Results are solved in base SI magnitudes and returned in these units
+UNITS = {'x': 'm', 's': 'm', 'deflection': 'm', 'slope': 'radian', 'shear': 'N', 'moment': 'N*m'}
+
+
+def solve(values: dict, num: int = 101, tol: float = 1e-10, max_iter: int = 50, block: int = 250) -> dict:
+    """Returns the large deflection results for many cases in one batched Newton solve.
+
+    values = dict of base SI magnitudes, each a scalar or an array over the cases ('F', 'a', 'w', 'L', 'EI').
+    Missing loads are zero, and 'a' defaults to the free end.
+    Like kernels.evaluate, every result has the shape (case, num) and the same names, so
+    plots and governing values work on it unchanged. 'x' is the horizontal position of each
+    point of the deformed beam and 's' its distance along the beam.
+    The solve starts from the linear (small deflection) slope and reports, for each case,
+    'converged', 'iterations' and the final 'residual' (largest slope error in radians).
+    Each case holds (num, num) matrices, so the cases are solved 'block' at a time.
+    """
+    values = {name: np.asarray(val, dtype=float) for name, val in values.items()}
+    L, EI = values['L'], values['EI']
+    F = values.get('F', 0 * L)
+    w = values.get('w', 0 * L)
+    a = np.clip(values.get('a', L), 0, L)
+    inputs = np.broadcast_arrays(F, w, a, L, EI)
+    shape = inputs[0].shape
+    inputs = [v.reshape(-1, 1) for v in inputs]
+    blocks = [_solve(*(v[i:i + block] for v in inputs), num, tol, max_iter) for i in range(0, len(inputs[0]), block)]
+    result = {name: np.concatenate([b[name] for b in blocks]) for name in blocks[0]}
+    result = {name: val.reshape(shape + val.shape[1:]) for name, val in result.items()}
+    for name, unit in UNITS.items():
+        result[name] = units.ureg.Quantity(result[name], unit)
+    return result
+
+
+def _solve(F, w, a, L, EI, num, tol, max_iter) -> dict:
+    """Returns the large deflection results of a block of cases, as base SI magnitudes."""
+    # One node always falls on the load, so the jump in shear is integrated exactly
+    j = np.clip(np.round(a / L * (num - 1)), 1, num - 1)
+    i = np.arange(num)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(i <= j, a * i / j, a + (L - a) * np.nan_to_num((i - j) / (num - 1 - j)))
+    h = np.diff(s, axis=-1)
+    # Load beyond each node, just after it (V_plus) and just before it (V_minus)
+    V_plus = w * (L - s) + F * (s < a)
+    V_minus = w * (L - s) + F * (s <= a)
+
+    # With trapezoidal integration the moment is a matrix per case, M = -W @ cos(theta),
+    # and integrating its rows along the beam gives theta = -G @ cos(theta)
+    upper = np.triu(np.ones((num, num)))
+    W = upper * _pad(h * V_plus[..., :-1] / 2, 0, 1)[..., None, :]
+    W = W + np.triu(upper, 1) * _pad(h * V_minus[..., 1:] / 2, 1, 0)[..., None, :]
+    G = _cumtrapz(W / EI[..., None], h[..., :, None], axis=-2)
+
+    # Warm start from the linear solution (cos(theta) = 1), within the physical range of slopes
+    theta = np.clip(-G.sum(axis=-1), -np.pi / 2, np.pi / 2)
+    iterations = np.zeros(len(theta), dtype=int)
+    eye = np.eye(num)
+    for _ in range(max_iter):
+        residual = theta + (G @ np.cos(theta)[..., None])[..., 0]
+        error = np.max(np.abs(residual), axis=-1)
+        converged = error < tol
+        if converged.all():
+            break
+        # Only the cases still iterating take a Newton step, limited so a far start cannot overshoot
+        active = ~converged
+        J = eye - G[active] * np.sin(theta[active])[..., None, :]
+        step = np.linalg.solve(J, residual[active][..., None])[..., 0]
+        theta[active] -= np.clip(step, -0.5, 0.5)
+        iterations[active] += 1
+
+    return {
+        'x': _cumtrapz(np.cos(theta), h),
+        's': s,
+        'deflection': _cumtrapz(np.sin(theta), h),
+        'slope': theta,
+        'shear': np.concatenate([V_plus[..., :1], V_minus[..., 1:]], axis=-1),
+        'moment': -(W @ np.cos(theta)[..., None])[..., 0],
+        'converged': converged,
+        'iterations': iterations,
+        'residual': error,
+    }
+
+
+def _cumtrapz(y, h, axis=-1):
+    """Returns the trapezoidal integral of y from the fixed end to each node, along 'axis'."""
+    y = np.moveaxis(y, axis, -1)
+    h = np.moveaxis(h, axis, -1)
+    return np.moveaxis(_pad(np.cumsum(h * (y[..., :-1] + y[..., 1:]) / 2, axis=-1), 1, 0), -1, axis)
+
+
+def _pad(y, before, after):
+    """Returns y padded with zeros along its last axis."""
+    return np.pad(y, [(0, 0)] * (y.ndim - 1) + [(before, after)])
+
+
+def section(beam):
+    """Renders the large deflection of 'beam' next to its linear (small deflection) result"""
+    st.markdown('### Large Deflection')
+    values = {name: val.to_base_units().magnitude for name, val in beam.inputs().items()}
+    result = solve(values)
+    # The load is placed on the beam as in 'solve', so the two results differ only by large deflection
+    if 'a' in values:
+        values['a'] = np.clip(values['a'], 0, values['L'])
+    linear = kernels.evaluate(beam.equations, values, 101)
+    plot('Beam Deflection (Large Deflection)', 'x', 'y', result['x'], result['deflection'], False, beam.minor['deflection'])
+    if not result['converged']:
+        st.error(f"The large deflection solve did not converge (slope error {result['residual']:.1e} rad)")
+    _max = kernels.governing(result['deflection'])
+    _linear = kernels.governing(linear['deflection'])
+    st.caption(f'Maximum Deflection = {units.unitdisplay(_max, minor=beam.minor["deflection"])}')
+    st.caption(
+        f'Linear Maximum Deflection = {units.unitdisplay(_linear, minor=beam.minor["deflection"])} '
+        f'({(_linear / _max - 1).to("").magnitude:+.1%} from the large deflection result)'
+    )
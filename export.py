@@ -0,0 +1,80 @@
+import os
+import numpy as np
+import pandas as pd
+import xarray as xr
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+
+
+def frame(results: dict, minor: bool | dict = False) -> pd.DataFrame:
+    """Returns a table of results with each one in both US Customary and SI units.
+
+    results = dict of quantity arrays (or lists of quantities) of the same length
+    minor = boolean, or dict of boolean per result (display as major unit (ft/m) or minor unit (in/mm))
+    Values are written at full precision (rounding is only for display), with the unit in each column name.
+    """
+    columns = {}
+    for name, vals in results.items():
+        _minor = minor.get(name, False) if type(minor) is dict else minor
+        for mag, symbol, _ in units.dual(vals, _minor):
+            columns[f'{name} [{symbol}]'] = np.ravel(mag)
+    return pd.DataFrame(columns)
+
+
+def frames(ds: xr.Dataset, minor: bool | dict = False, cases: int = 1000):
+    """Yields the tables of a results dataset (see results.py), a block of cases at a time.
+
+    Only one block of cases is computed and held in memory at once, so dask backed studies
+    larger than memory can be exported.
+    Every row carries the inputs of its case and its position, with values shared by all
+    cases (such as a single length) repeated on each row. Inputs come first, then the results.
+    """
+    names = sorted(ds.data_vars, key=lambda name: 'x' in ds[name].dims)
+    for start in range(0, ds.sizes['case'], cases):
+        block = ds[names].isel(case=slice(start, start + cases)).pint.dequantify().compute()
+        case = np.arange(start, start + block.sizes['case'])
+        dims = ('case', 'x') if 'x' in block.dims else ('case',)
+        shape = tuple(len(case) if dim == 'case' else block.sizes[dim] for dim in dims)
+        if 'x' in block.dims:
+            index = {'case': np.repeat(case, block.sizes['x']), 'x/L': np.tile(block['x'].values, len(case))}
+        else:
+            index = {'case': case}
+        table = frame({name: _broadcast(block[name], dims, shape) for name in names}, minor)
+        yield pd.concat([pd.DataFrame(index), table], axis=1)
+
+
+def _broadcast(da: xr.DataArray, dims: tuple, shape: tuple) -> units.ureg.Quantity:
+    """Returns a dequantified variable as a quantity array over 'dims', repeating it along the dims it lacks."""
+    values = da.expand_dims([dim for dim in dims if dim not in da.dims]).transpose(*dims).values
+    return units.ureg.Quantity(np.broadcast_to(values, shape), da.attrs.get('units', ''))
+
+
+def write(data: dict | xr.Dataset, path: str, minor: bool | dict = False, cases: int = 1000):
+    """Writes results with both US Customary and SI columns to CSV (.csv), Excel (.xlsx) or Parquet (.parquet).
+
+    data = dict of quantity arrays, or a results dataset (see results.py) written a block of cases at a time
+    """
+    tables = frames(data, minor, cases) if isinstance(data, xr.Dataset) else [frame(data, minor)]
+    match os.path.splitext(path)[1].lower():
+        case '.csv':
+            for i, table in enumerate(tables):
+                table.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+        case '.parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            writer = None
+            try:
+                for table in tables:
+                    table = pa.Table.from_pandas(table, preserve_index=False)
+                    writer = writer or pq.ParquetWriter(path, table.schema)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+        case '.xlsx':
+            row = 0
+            with pd.ExcelWriter(path) as writer:
+                for table in tables:
+                    table.to_excel(writer, startrow=row, header=row == 0, index=False)
+                    row += len(table) + (row == 0)
+        case ext:
+            raise ValueError(f"Unsupported export format '{ext}', use .csv, .xlsx or .parquet")
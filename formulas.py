@@ -1,22 +1,30 @@
 import streamlit as st
-import numpy as np
 from datetime import datetime
 import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
-from plot import plot  # plot.py: No changes to plot.py will be accepted, unless use case is fully justified.
+import adaptive  # adaptive.py: Places the x values along the beam where the results need them.
+import kernels  # kernels.py: Compiles the symbolic formulas declared below into markdown and numpy kernels.
+import registry  # registry.py: Lists the calc classes below in the selector, without importing this module.
+from plot import plot, plotAll  # plot.py: No changes to plot.py will be accepted, unless use case is fully justified.
 
 
-def check_validity(self, expireDate):
+def check_validity(self, expireDate=None):
     """Disable calculation if date has passed
 
     If the calculations are dependent on a code that is frequently changed,
     prevent the results to be shown until the code is updated.
+    The date defaults to the 'expires' date the class was registered with.
     """
+    if expireDate is None:
+        expireDate = datetime.fromisoformat(self.meta['expires'])
     if datetime.today() > expireDate:
         st.error('This calculation set has expired and requires updating')
         st.warning('Please notify your discipline lead.')
         raise Exception(f'[{self}]')
 
 
+# Each calc class is registered with its metadata. The arguments must be literals,
+# since the selector index is built by reading this file rather than importing it.
+@registry.register(name='Cantilever, End Loaded', category='Cantilever', expires='2024-12-01', inputs=('F', 'L', 'EI'))
 class CantileverEndLoad():
     """Return the values of deflection, slope, shear, and moment
 
@@ -25,8 +33,30 @@ class CantileverEndLoad():
     Calculations from Gere, Lindeburg, and Shigley
     """
 
+    # Each formula is declared once, in sympy notation, with the units of its result.
+    # Both the rendered markdown and the numerical results are generated from these
+    # declarations through 'kernels.Formula', so the two can never disagree.
+    equations = {
+        'deflection': kernels.Formula('delta', '-F*x**2/(6*EI)*(3*L - x)', 'm'),
+        'slope': kernels.Formula('theta', '-F*x/(2*EI)*(2*L - x)', 'radian'),
+        'shear': kernels.Formula('V', 'F', 'N'),
+        'moment': kernels.Formula('M', '-F*(L - x)', 'N*m'),
+    }
+
+    # Characteristic value of each result. Divided by it, each result becomes a dimensionless
+    # shape of x/L (and a/L), which 'shapes.py' tabulates for instant interactive updates.
+    scales = {
+        'deflection': kernels.Formula('delta_0', 'F*L**3/EI', 'm'),
+        'slope': kernels.Formula('theta_0', 'F*L**2/EI', 'radian'),
+        'shear': kernels.Formula('V_0', 'F', 'N'),
+        'moment': kernels.Formula('M_0', 'F*L', 'N*m'),
+    }
+
+    # Results shown in minor units (in, lbf) rather than major units (ft, kip), wherever they are displayed
+    minor = {'deflection': True, 'slope': False, 'shear': True, 'moment': False}
+
     def __init__(self):
-        check_validity(self, datetime(year=2024, month=12, day=1))
+        check_validity(self)
         # Input Data Caption
         st.markdown('### Input')
 
@@ -59,53 +89,60 @@ class CantileverEndLoad():
         inertia = units.input('Second Moment of Area', '209 in**4', True)
         self.EI = modulus * inertia
         # For this example, we want to plot the beam properties over its length
-        # So we use the numpy (np) 'linspace' command to create a range of values
-        self._x = np.linspace((0*self.L).to_base_units(), self.L.to_base_units(), num=100, endpoint=True)
+        # So we use 'adaptive.sample()' to create a range of values, with more points only where the results bend
+        self._x = adaptive.sample(self.equations, self.inputs())
+
+    @classmethod
+    def from_inputs(cls, **inputs):
+        """Returns the calc for inputs given directly, without the input fields (see report.py)
+
+        inputs = quantity | str (set by .load) for each name in 'inputs()'
+        """
+        self = cls.__new__(cls)
+        check_validity(self)
+        self.F, self.L, self.EI = (units.load(inputs[name]) if type(inputs[name]) is str else inputs[name] for name in ('F', 'L', 'EI'))
+        self._x = adaptive.sample(self.equations, self.inputs())
+        return self
 
     def x(self):
         return self._x
 
+    def inputs(self):
+        return {'F': self.F, 'L': self.L, 'EI': self.EI}
+
     def markdown(self):
-        md = """
-        |  |  |
-        | :--- | --- |
-        | Deflection | $ \delta = {Fx^2 \over 6EI} \cdot (3L-x)$ |
-        | Slope | $\\theta = -{Fx \over 2EI} \cdot (2L-x)$ |
-        | Shear | $V = +F$ |
-        | Moment | $M = -F(L-x)$ |
-        """
-        return md
+        return kernels.markdown([(name.capitalize(), eq) for name, eq in self.equations.items()])
 
     def deflection(self, x):
-        return -((self.F * x**2)/(6 * self.EI)) * (3 * self.L - x)
+        return self.equations['deflection'](x=x, **self.inputs())
 
+    # The maxima are taken from the declared formulas along the beam, so their signs always match the results
     def maxDeflection(self):
-        return ((self.F * self.L**3) / (3 * self.EI))
+        return kernels.governing(self.deflection(self._x))
 
     def slope(self, x):
-        return -((self.F * x)/(2 * self.EI))*(2 * self.L - x)
+        return self.equations['slope'](x=x, **self.inputs())
 
     def maxSlope(self):
-        return ((self.F * self.L**2)/(2*self.EI))
+        return kernels.governing(self.slope(self._x))
 
-    def shear(self):
-        return self.F
+    def shear(self, x):
+        return self.equations['shear'](x=x, **self.inputs())
 
     def maxShear(self):
-        return self.F
+        return kernels.governing(self.shear(self._x))
 
     def moment(self, x):
-        return -(self.F * (self.L - x))
+        return self.equations['moment'](x=x, **self.inputs())
 
     def maxMoment(self):
-        return -(self.F * self.L)
+        return kernels.governing(self.moment(self._x))
 
     def plotDeflection(self):
-        # The syntax [do_something_to x for x in xlist], iterates over the xlist,
-        # pulling out a single value assigned as x, and does something to it
+        # The formulas accept a single value or the full array of 'x' at once
         # if called for "deflection('12ft')" then we would get a single result for the deflection at '12ft'
-        # by iterating over the full list of 'x', we can get a list of corresponding values
-        deflection = [self.deflection(x).to_base_units() for x in self._x]
+        # by passing the full array of 'x', we get an array of corresponding values in a single evaluation
+        deflection = self.deflection(self._x).to_base_units()
 
         # Since we have two lists of equal length, x and deflection, we plot these by using the 'plot()' function
         # The plot size, unit display, interactivity, and tooltip is handled within this function
@@ -115,18 +152,36 @@ class CantileverEndLoad():
         st.caption(f'Maximum Deflection = {units.unitdisplay(maxd, minor=True)}')
 
     def plotShear(self):
-        shear = [self.shear().to_base_units() for x in self._x]
+        shear = self.shear(self._x).to_base_units()
         plot('Beam Shear', 'x', 'y', self._x, shear, False, True)
         maxshear = self.maxShear()
         st.caption(f'Maximum Shear = {units.unitdisplay(maxshear, minor=True)}')
 
     def plotMoment(self):
-        moment = [self.moment(x).to_base_units() for x in self._x]
+        moment = self.moment(self._x).to_base_units()
         plot('Beam Moment', 'x', 'y', self._x, moment, False, False)
         maxmoment = self.maxMoment()
         st.caption(f'Maximum Moment = {units.unitdisplay(maxmoment)}')
 
-
+    def plotAll(self, results=None):
+        # All results in one chart of linked panels, drawn from one dataset along the same x
+        # The x values are formatted once for every panel, rather than once per plot
+        # Results already computed for this case (see session.remember) may be passed in
+        if results is None:
+            results = {'x': self._x, **{name: getattr(self, name)(self._x) for name in self.equations}}
+        plotAll('Beam Results', 'x', results['x'], {
+            'Deflection': (results['deflection'], self.minor['deflection']),
+            'Slope': (results['slope'], self.minor['slope']),
+            'Shear': (results['shear'], self.minor['shear']),
+            'Moment': (results['moment'], self.minor['moment']),
+        })
+        st.caption(f'Maximum Deflection = {units.unitdisplay(self.maxDeflection(), minor=self.minor["deflection"])}')
+        st.caption(f"Maximum Slope = {units.unitdisplay(self.maxSlope().to('radian'))}")
+        st.caption(f'Maximum Shear = {units.unitdisplay(self.maxShear(), minor=self.minor["shear"])}')
+        st.caption(f'Maximum Moment = {units.unitdisplay(self.maxMoment(), minor=self.minor["moment"])}')
+
+
+@registry.register(name='Cantilever, Intermediate Loaded', category='Cantilever', expires='2024-12-01', inputs=('F', 'a', 'L', 'EI'))
 class CantileverIntermediateLoad():
     """Return the values of deflection, slope, shear, and moment
 
@@ -134,8 +189,38 @@ class CantileverIntermediateLoad():
     Fixed at the left and free to the right
     Calculations common to Gere, Lindeburg, and Shigley
     """
+    # Piecewise formulas are declared as a list of (expression, range) pieces
+    equations = {
+        'deflection': kernels.Formula('delta', [
+            ('-F*x**2/(6*EI)*(3*a - x)', 'x <= a'),
+            ('-F*a**2/(6*EI)*(3*x - a)', 'x > a'),
+        ], 'm'),
+        'slope': kernels.Formula('theta', [
+            ('-F*x/(2*EI)*(2*a - x)', 'x <= a'),
+            ('-F*a**2/(2*EI)', 'x > a'),
+        ], 'radian'),
+        'shear': kernels.Formula('V', [
+            ('F', 'x <= a'),
+            ('0', 'x > a'),
+        ], 'N'),
+        'moment': kernels.Formula('M', [
+            ('-F*(a - x)', 'x <= a'),
+            ('0', 'x > a'),
+        ], 'N*m'),
+    }
+
+    scales = {
+        'deflection': kernels.Formula('delta_0', 'F*L**3/EI', 'm'),
+        'slope': kernels.Formula('theta_0', 'F*L**2/EI', 'radian'),
+        'shear': kernels.Formula('V_0', 'F', 'N'),
+        'moment': kernels.Formula('M_0', 'F*L', 'N*m'),
+    }
+
+    # Results shown in minor units (in, lbf) rather than major units (ft, kip), wherever they are displayed
+    minor = {'deflection': True, 'slope': False, 'shear': True, 'moment': False}
+
     def __init__(self):
-        check_validity(self, datetime(year=2024, month=12, day=1))
+        check_validity(self)
         # Input Data Caption
         st.markdown('### Input')
 
@@ -171,77 +256,60 @@ class CantileverIntermediateLoad():
         inertia = units.input('Second Moment of Area', '209 in**4', True)
         self.EI = modulus * inertia
         # For this example, we want to plot the beam properties over its length
-        # So we use the numpy (np) 'linspace' command to create a range of values
-        self._x = np.linspace((0*self.L).to_base_units(), self.L.to_base_units(), num=100, endpoint=True)
+        # So we use 'adaptive.sample()' to create a range of values, with more points only where the results bend
+        # The load position 'a' is a breakpoint, where shear jumps and moment changes slope
+        self._x = adaptive.sample(self.equations, self.inputs(), breakpoints=[self.a])
+
+    @classmethod
+    def from_inputs(cls, **inputs):
+        """Returns the calc for inputs given directly, without the input fields (see report.py)
+
+        inputs = quantity | str (set by .load) for each name in 'inputs()'
+        """
+        self = cls.__new__(cls)
+        check_validity(self)
+        self.F, self.a, self.L, self.EI = (units.load(inputs[name]) if type(inputs[name]) is str else inputs[name] for name in ('F', 'a', 'L', 'EI'))
+        self._x = adaptive.sample(self.equations, self.inputs(), breakpoints=[self.a])
+        return self
 
     def x(self):
         return self._x
 
-    def markdown(self):
-        md = """
-        |  |  | |
-        | :--- | --- | --- |
-        | Deflection | $ \delta = {Fx^2 \over 6EI} \cdot (3a-x)$ | $(0 \leq x \leq a)$ |
-        | | $ \delta = {Fa^2 \over 6EI} \cdot (3x-a)$ | $(a \leq x \leq L)$ |
-        | Slope | $\\theta = -{Fx \over 2EI} \cdot (2a-x)$ | $(0 \leq x \leq a)$ |
-        | | $\\theta = -{Fa^2 \over 2EI}$ | $(a \leq x \leq L)$ |
-        | Shear | $V = +F$ | $(0 \leq x \leq a)$ |
-        | | $V = 0$ | $(a \leq x \leq L)$ |
-        | Moment | $M = -F(a-x)$ | $(0 \leq x \leq a)$ |
-        | | $M = 0$ | $(a \leq x \leq L)$ |
-        """
-        return md
+    def inputs(self):
+        return {'F': self.F, 'a': self.a, 'L': self.L, 'EI': self.EI}
 
-    def return_max(self, _list):
-        _min = min(_list)
-        _max = max(_list)
-        return _max if abs(_max) > abs(_min) else _min
+    def markdown(self):
+        return kernels.markdown([(name.capitalize(), eq) for name, eq in self.equations.items()])
 
     def deflection(self, x):
-        if x <= self.a:
-            return -((self.F * x**2)/(6 * self.EI)) * (3 * self.a - x)
-        else:
-            return -((self.F * self.a**2)/(6 * self.EI)) * (3 * x - self.a)
+        return self.equations['deflection'](x=x, **self.inputs())
 
     def maxDeflection(self):
-        return (((self.F * self.a**2) / (6 * self.EI)) * (3 * self.L - self.a))
+        return kernels.governing(self.deflection(self._x))
 
     def slope(self, x):
-        if x <= self.a:
-            return -((self.F * x)/(2 * self.EI))*(2 * self.a - x)
-        else:
-            return -((self.F * self.a**2)/(2 * self.EI))
+        return self.equations['slope'](x=x, **self.inputs())
 
     def maxSlope(self):
-        _slopes = [self.slope(x).to_base_units() for x in self._x]
-        return self.return_max(_slopes)
+        return kernels.governing(self.slope(self._x))
 
     def shear(self, x):
-        if x <= self.a:
-            return self.F
-        else:
-            return self.F * 0  # Maintains intended units
+        return self.equations['shear'](x=x, **self.inputs())
 
     def maxShear(self):
-        _shear = [self.shear(x).to_base_units() for x in self._x]
-        return self.return_max(_shear)
+        return kernels.governing(self.shear(self._x))
 
     def moment(self, x):
-        if x <= self.a:
-            return -(self.F * (self.a - x))
-        else:
-            return self.F * self.a * 0  # Maintains intended units
+        return self.equations['moment'](x=x, **self.inputs())
 
     def maxMoment(self):
-        _moment = [self.moment(x).to_base_units() for x in self._x]
-        return self.return_max(_moment)
+        return kernels.governing(self.moment(self._x))
 
     def plotDeflection(self):
-        # The syntax [do_something_to x for x in xlist], iterates over the xlist,
-        # pulling out a single value assigned as x, and does something to it
+        # The formulas accept a single value or the full array of 'x' at once
         # if called for "deflection('12ft')" then we would get a single result for the deflection at '12ft'
-        # by iterating over the full list of 'x', we can get a list of corresponding values
-        deflection = [self.deflection(x).to_base_units() for x in self._x]
+        # by passing the full array of 'x', we get an array of corresponding values in a single evaluation
+        deflection = self.deflection(self._x).to_base_units()
 
         # Since we have two lists of equal length, x and deflection, we plot these by using the 'plot()' function
         # The plot size, unit display, interactivity, and tooltip is handled within this function
@@ -251,18 +319,36 @@ class CantileverIntermediateLoad():
         st.caption(f'Maximum Deflection = {units.unitdisplay(maxd, minor=True)}')
 
     def plotShear(self):
-        shear = [self.shear(x).to_base_units() for x in self._x]
+        shear = self.shear(self._x).to_base_units()
         plot('Beam Shear', 'x', 'y', self._x, shear, False, True)
         maxshear = self.maxShear()
         st.caption(f'Maximum Shear = {units.unitdisplay(maxshear, minor=True)}')
 
     def plotMoment(self):
-        moment = [self.moment(x).to_base_units() for x in self._x]
+        moment = self.moment(self._x).to_base_units()
         plot('Beam Moment', 'x', 'y', self._x, moment, False, False)
         maxmoment = self.maxMoment()
         st.caption(f'Maximum Moment = {units.unitdisplay(maxmoment)}')
 
-
+    def plotAll(self, results=None):
+        # All results in one chart of linked panels, drawn from one dataset along the same x
+        # The x values are formatted once for every panel, rather than once per plot
+        # Results already computed for this case (see session.remember) may be passed in
+        if results is None:
+            results = {'x': self._x, **{name: getattr(self, name)(self._x) for name in self.equations}}
+        plotAll('Beam Results', 'x', results['x'], {
+            'Deflection': (results['deflection'], self.minor['deflection']),
+            'Slope': (results['slope'], self.minor['slope']),
+            'Shear': (results['shear'], self.minor['shear']),
+            'Moment': (results['moment'], self.minor['moment']),
+        })
+        st.caption(f'Maximum Deflection = {units.unitdisplay(self.maxDeflection(), minor=self.minor["deflection"])}')
+        st.caption(f"Maximum Slope = {units.unitdisplay(self.maxSlope().to('radian'))}")
+        st.caption(f'Maximum Shear = {units.unitdisplay(self.maxShear(), minor=self.minor["shear"])}')
+        st.caption(f'Maximum Moment = {units.unitdisplay(self.maxMoment(), minor=self.minor["moment"])}')
+
+
+@registry.register(name='Cantilever, Uniform Distributed Load', category='Cantilever', expires='2024-12-01', inputs=('w', 'L', 'EI'))
 class CantileverUniformDistributedLoad():
     """Return the values of deflection, slope, shear, and moment
 
@@ -270,8 +356,25 @@ class CantileverUniformDistributedLoad():
     Fixed at the left and free to the right
     Calculations common to Gere, Lindeburg, and Shigley
     """
+    equations = {
+        'deflection': kernels.Formula('delta', '-w*x**2/(24*EI)*(6*L**2 - 4*L*x + x**2)', 'm'),
+        'slope': kernels.Formula('theta', '-w*x/(6*EI)*(3*L**2 - 3*L*x + x**2)', 'radian'),
+        'shear': kernels.Formula('V', 'w*(L - x)', 'N'),
+        'moment': kernels.Formula('M', '-w*(L - x)**2/2', 'N*m'),
+    }
+
+    scales = {
+        'deflection': kernels.Formula('delta_0', 'w*L**4/EI', 'm'),
+        'slope': kernels.Formula('theta_0', 'w*L**3/EI', 'radian'),
+        'shear': kernels.Formula('V_0', 'w*L', 'N'),
+        'moment': kernels.Formula('M_0', 'w*L**2', 'N*m'),
+    }
+
+    # Results shown in minor units (in, lbf) rather than major units (ft, kip), wherever they are displayed
+    minor = {'deflection': True, 'slope': False, 'shear': True, 'moment': False}
+
     def __init__(self):
-        check_validity(self, datetime(year=2024, month=12, day=1))
+        check_validity(self)
         # Input Data Caption
         st.markdown('### Input')
 
@@ -297,62 +400,59 @@ class CantileverUniformDistributedLoad():
         inertia = units.input('Second Moment of Area', '209 in**4', True)
         self.EI = modulus * inertia
         # For this example, we want to plot the beam properties over its length
-        # So we use the numpy (np) 'linspace' command to create a range of values
-        self._x = np.linspace((0*self.L).to_base_units(), self.L.to_base_units(), num=100, endpoint=True)
+        # So we use 'adaptive.sample()' to create a range of values, with more points only where the results bend
+        self._x = adaptive.sample(self.equations, self.inputs())
+
+    @classmethod
+    def from_inputs(cls, **inputs):
+        """Returns the calc for inputs given directly, without the input fields (see report.py)
+
+        inputs = quantity | str (set by .load) for each name in 'inputs()'
+        """
+        self = cls.__new__(cls)
+        check_validity(self)
+        self.w, self.L, self.EI = (units.load(inputs[name]) if type(inputs[name]) is str else inputs[name] for name in ('w', 'L', 'EI'))
+        self._x = adaptive.sample(self.equations, self.inputs())
+        return self
 
     def x(self):
         return self._x
 
-    def markdown(self):
-        md = """
-        |  |  |
-        | :--- | --- |
-        | Deflection | $ \delta = -{\\omega x^2 \over 24EI} \cdot (6L^2-4Lx+x^2)$ |
-        | Slope | $\\theta = -{\\omega x \over 6EI} \cdot (3L^2-3Lx+x)$ |
-        | Shear | $V = +\\omega (L-x)$ |
-        | Moment | $M = -\\omega (L-x)^2/2$ |
-        """
-        return md
+    def inputs(self):
+        return {'w': self.w, 'L': self.L, 'EI': self.EI}
 
-    def return_max(self, _list):
-        _min = min(_list)
-        _max = max(_list)
-        return _max if abs(_max) > abs(_min) else _min
+    def markdown(self):
+        return kernels.markdown([(name.capitalize(), eq) for name, eq in self.equations.items()])
 
     def deflection(self, x):
-        return -((self.w * x**2)/(24 * self.EI)) * (6 * self.L**2 - 4 * self.L * x + x**2)
+        return self.equations['deflection'](x=x, **self.inputs())
 
     def maxDeflection(self):
-        _defl = [self.deflection(x).to_base_units() for x in self._x]
-        return self.return_max(_defl)
+        return kernels.governing(self.deflection(self._x))
 
     def slope(self, x):
-        return -((self.w * x)/(6 * self.EI)) * (3 * self.L**2 - 3 * self.L * x + x)
+        return self.equations['slope'](x=x, **self.inputs())
 
     def maxSlope(self):
-        _slopes = [self.slope(x).to_base_units() for x in self._x]
-        return self.return_max(_slopes)
+        return kernels.governing(self.slope(self._x))
 
     def shear(self, x):
-        return self.w * (self.L - x)
+        return self.equations['shear'](x=x, **self.inputs())
 
     def maxShear(self):
-        _shear = [self.shear(x).to_base_units() for x in self._x]
-        return self.return_max(_shear)
+        return kernels.governing(self.shear(self._x))
 
     def moment(self, x):
-        return -(self.w * (self.L - x)**2 / 2)
+        return self.equations['moment'](x=x, **self.inputs())
 
     def maxMoment(self):
-        _moment = [self.moment(x).to_base_units() for x in self._x]
-        return self.return_max(_moment)
+        return kernels.governing(self.moment(self._x))
 
     def plotDeflection(self):
-        # The syntax [do_something_to x for x in xlist], iterates over the xlist,
-        # pulling out a single value assigned as x, and does something to it
+        # The formulas accept a single value or the full array of 'x' at once
         # if called for "deflection('12ft')" then we would get a single result for the deflection at '12ft'
-        # by iterating over the full list of 'x', we can get a list of corresponding values
-        deflection = [self.deflection(x).to_base_units() for x in self._x]
+        # by passing the full array of 'x', we get an array of corresponding values in a single evaluation
+        deflection = self.deflection(self._x).to_base_units()
 
         # Since we have two lists of equal length, x and deflection, we plot these by using the 'plot()' function
         # The plot size, unit display, interactivity, and tooltip is handled within this function
@@ -362,13 +462,30 @@ class CantileverUniformDistributedLoad():
         st.caption(f'Maximum Deflection = {units.unitdisplay(maxd, minor=True)}')
 
     def plotShear(self):
-        shear = [self.shear(x).to_base_units() for x in self._x]
+        shear = self.shear(self._x).to_base_units()
         plot('Beam Shear', 'x', 'y', self._x, shear, False, True)
         maxshear = self.maxShear()
         st.caption(f'Maximum Shear = {units.unitdisplay(maxshear, minor=True)}')
 
     def plotMoment(self):
-        moment = [self.moment(x).to_base_units() for x in self._x]
+        moment = self.moment(self._x).to_base_units()
         plot('Beam Moment', 'x', 'y', self._x, moment, False, False)
         maxmoment = self.maxMoment()
         st.caption(f'Maximum Moment = {units.unitdisplay(maxmoment)}')
+
+    def plotAll(self, results=None):
+        # All results in one chart of linked panels, drawn from one dataset along the same x
+        # The x values are formatted once for every panel, rather than once per plot
+        # Results already computed for this case (see session.remember) may be passed in
+        if results is None:
+            results = {'x': self._x, **{name: getattr(self, name)(self._x) for name in self.equations}}
+        plotAll('Beam Results', 'x', results['x'], {
+            'Deflection': (results['deflection'], self.minor['deflection']),
+            'Slope': (results['slope'], self.minor['slope']),
+            'Shear': (results['shear'], self.minor['shear']),
+            'Moment': (results['moment'], self.minor['moment']),
+        })
+        st.caption(f'Maximum Deflection = {units.unitdisplay(self.maxDeflection(), minor=self.minor["deflection"])}')
+        st.caption(f"Maximum Slope = {units.unitdisplay(self.maxSlope().to('radian'))}")
+        st.caption(f'Maximum Shear = {units.unitdisplay(self.maxShear(), minor=self.minor["shear"])}')
+        st.caption(f'Maximum Moment = {units.unitdisplay(self.maxMoment(), minor=self.minor["moment"])}')
@@ -0,0 +1,179 @@
+import os
+import types
+import hashlib
+import importlib.util
+import numpy as np
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+
+
+# Bump when the generated module layout changes so stale cache files are ignored.
+VERSION = 1
+
+# Compiled kernels are written here and imported on later runs, so sympy is only
+# needed the first time a formula is seen.
+CACHE_DIR = os.environ.get(
+    'STV_KERNEL_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.kernel_cache')
+)
+
+# LaTeX names for symbols that should not render as their python name.
+LATEX_NAMES = {
+    'w': '\\omega',
+    'theta': '\\theta',
+    'delta': '\\delta',
+}
+
+_TEMPLATE = '''# Generated by kernels.py from a symbolic formula. Do not edit.
+import numpy
+
+ARGS = {args!r}
+LATEX = {latex!r}
+
+
+def kernel({signature}):
+{body}
+'''
+
+
+class Formula():
+    """A formula declared once, symbolically
+
+    The expression is written as a sympy string (or a list of (expression, condition)
+    pieces for piecewise formulas). From it both the rendered LaTeX and a vectorized
+    NumPy kernel, with common subexpressions precomputed, are generated.
+    The kernel works in base SI magnitudes and returns a quantity in 'unit'.
+    """
+
+    def __init__(self, symbol: str, expr: str | list, unit: str):
+        self.symbol = symbol
+        self.pieces = [(expr, None)] if type(expr) is str else list(expr)
+        self.unit = unit
+        self._module = None
+
+    def key(self) -> str:
+        source = repr((VERSION, self.symbol, self.pieces))
+        return hashlib.sha256(source.encode()).hexdigest()[:20]
+
+    def module(self):
+        """Returns the compiled kernel module, loading it from disk or compiling it once."""
+        if self._module is None:
+            path = os.path.join(CACHE_DIR, f'k_{self.key()}.py')
+            if not os.path.exists(path):
+                source = self.compile()
+                try:
+                    _write(path, source)
+                except OSError:
+                    # A read-only deployment compiles the kernel in memory, once per process
+                    self._module = types.ModuleType(f'_kernel_{self.key()}')
+                    exec(compile(source, path, 'exec'), self._module.__dict__)
+                    return self._module
+            spec = importlib.util.spec_from_file_location(f'_kernel_{self.key()}', path)
+            self._module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(self._module)
+        return self._module
+
+    def compile(self) -> str:
+        """Returns the source of the kernel module generated through sympy."""
+        import sympy as sp
+        from sympy.printing.numpy import NumPyPrinter
+
+        names = set()
+        for expr, cond in self.pieces:
+            names |= {str(s) for s in sp.sympify(expr).free_symbols}
+            if cond is not None:
+                names |= {str(s) for s in sp.sympify(cond).free_symbols}
+        symbols = {n: sp.Symbol(n) for n in sorted(names)}
+        parsed = [
+            (sp.sympify(expr, locals=symbols), None if cond is None else sp.sympify(cond, locals=symbols))
+            for expr, cond in self.pieces
+        ]
+        latex_names = {s: LATEX_NAMES[n] for n, s in symbols.items() if n in LATEX_NAMES}
+        latex = [
+            (
+                f'{sp.latex(sp.Symbol(self.symbol), symbol_names=latex_names)} = '
+                f'{sp.latex(expr, symbol_names=latex_names)}',
+                None if cond is None else f'({sp.latex(cond, symbol_names=latex_names)})'
+            ) for expr, cond in parsed
+        ]
+        if len(parsed) == 1:
+            full = parsed[0][0]
+        else:
+            full = sp.Piecewise(*parsed)
+        replacements, (reduced,) = sp.cse([full])
+        printer = NumPyPrinter({'fully_qualified_modules': True})
+        lines = [f'    {lhs} = {printer.doprint(rhs)}' for lhs, rhs in replacements]
+        lines.append(f'    return {printer.doprint(reduced)}')
+        return _TEMPLATE.format(
+            args=tuple(symbols),
+            latex=latex,
+            signature=', '.join(symbols),
+            body='\n'.join(lines)
+        )
+
+    @property
+    def args(self) -> tuple:
+        return self.module().ARGS
+
+    @property
+    def latex(self) -> list:
+        return self.module().LATEX
+
+    def __call__(self, **values) -> units.ureg.Quantity:
+        """Returns the formula evaluated for the given quantities (scalars or arrays)."""
+        mags = [_magnitude(values[arg]) for arg in self.args]
+        result = self.module().kernel(*mags)
+        # Formulas that do not depend on every argument (V = F) still follow the shape of x
+        shape = np.broadcast_shapes(*[np.shape(m) for m in mags], np.shape(values.get('x', 0)))
+        return units.ureg.Quantity(np.broadcast_to(result, shape).astype(float), self.unit)
+
+
+def _magnitude(val):
+    try:
+        return np.asarray(val.to_base_units().magnitude, dtype=float)
+    except AttributeError:
+        return np.asarray(val, dtype=float)
+
+
+def _write(path, source):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(source)
+    os.replace(tmp, path)
+
+
+def markdown(rows: list) -> str:
+    """Returns a markdown table of formulas.
+
+    rows = list of (label, Formula). Piecewise formulas add a column for their range.
+    """
+    pieces = any(len(formula.latex) > 1 or formula.latex[0][1] for _, formula in rows)
+    md = '|  |  | |\n| :--- | --- | --- |\n' if pieces else '|  |  |\n| :--- | --- |\n'
+    for label, formula in rows:
+        for i, (expr, cond) in enumerate(formula.latex):
+            name = label if i == 0 else ''
+            if pieces:
+                md += f'| {name} | ${expr}$ | {f"${cond}$" if cond else ""} |\n'
+            else:
+                md += f'| {name} | ${expr}$ |\n'
+    return md
+
+
+def evaluate(equations: dict, values: dict, num: int = 100) -> dict:
+    """Returns x and each equation for many cases in one vectorized evaluation.
+
+    values = dict of base SI magnitudes, each a scalar or an array over the cases.
+    x spans 0 to L with 'num' points, so every result has the shape (case, num).
+    """
+    values = {name: np.asarray(val, dtype=float)[..., None] for name, val in values.items()}
+    x = values['L'] * np.linspace(0, 1, num)
+    results = {'x': units.ureg.Quantity(x, 'm')}
+    for name, eq in equations.items():
+        results[name] = eq(x=x, **values)
+    return results
+
+
+def governing(y: units.ureg.Quantity) -> units.ureg.Quantity:
+    """Returns the value with the largest magnitude along the last axis, keeping its sign."""
+    idx = np.argmax(np.abs(y.magnitude), axis=-1)[..., None]
+    return units.ureg.Quantity(np.take_along_axis(y.magnitude, idx, axis=-1)[..., 0], y.units)
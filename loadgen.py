@@ -0,0 +1,101 @@
+"""Load generator for 'service.py'
+
+Opens many keep-alive connections against a running service and reports latency
+percentiles and throughput. Use ```--spawn``` to start a local service for the run.
+
+    python loadgen.py --spawn --connections 64 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+import numpy as np
+
+
+def random_case() -> dict:
+    """Returns a random case for one of the calculations."""
+    calc = random.choice(('CantileverEndLoad', 'CantileverIntermediateLoad', 'CantileverUniformDistributedLoad'))
+    L = random.uniform(5, 40)
+    inputs = {'L': f'{L} ft', 'EI': f'{random.uniform(1e9, 1e10)} lbf*in**2'}
+    if calc == 'CantileverUniformDistributedLoad':
+        inputs['w'] = f'{random.uniform(10, 500)} lbf/ft'
+    else:
+        inputs['F'] = f'{random.uniform(100, 5000)} lbf'
+    if calc == 'CantileverIntermediateLoad':
+        inputs['a'] = f'{random.uniform(0, L)} ft'
+    return {'calc': calc, 'inputs': inputs, 'num': 100}
+
+
+async def client(host, port, stop_at, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < stop_at:
+            body = json.dumps(random_case()).encode()
+            start = time.perf_counter()
+            writer.write(
+                f'POST /calc HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+                f'Content-Length: {len(body)}\r\n\r\n'.encode() + body
+            )
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while (line := await reader.readline()) not in (b'\r\n', b''):
+                name, _, value = line.decode().partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 503:
+                await asyncio.sleep(0.01)  # back off when the service is saturated
+    finally:
+        writer.close()
+
+
+async def run(host, port, connections, duration):
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    stop_at = start + duration
+    await asyncio.gather(*[client(host, port, stop_at, latencies, statuses) for _ in range(connections)])
+    elapsed = time.perf_counter() - start
+    ms = np.array(latencies) * 1000
+    print(f'Requests    {len(ms)} in {elapsed:.1f} s over {connections} connections')
+    print(f'Throughput  {statuses.get(200, 0) / elapsed:.0f} cases/s')
+    print(f'Latency     p50 {np.percentile(ms, 50):.1f} ms | p99 {np.percentile(ms, 99):.1f} ms | max {ms.max():.1f} ms')
+    print(f'Status      {dict(sorted(statuses.items()))}')
+
+
+async def wait_for(host, port, timeout=60):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--connections', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--spawn', action='store_true', help='start service.py for the duration of the run')
+    args = parser.parse_args()
+    server = None
+    if args.spawn:
+        server = subprocess.Popen([sys.executable, 'service.py', '--host', args.host, '--port', str(args.port)])
+    try:
+        asyncio.run(wait_for(args.host, args.port))
+        asyncio.run(run(args.host, args.port, args.connections, args.duration))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
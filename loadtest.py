@@ -0,0 +1,143 @@
+"""Load test of the calc pages, with many simulated sessions and no browser
+
+Drives 'SingleCalc.py' and 'MultiCalc.py' through Streamlit's app testing facility. Each
+session runs in its own process, changes inputs and switches beam types at random, and
+reports its rerun latency, CPU time and peak memory. Sessions run a few at a time, as
+concurrent users would share the box.
+
+    python loadtest.py --sessions 16 --concurrency 4 --steps 10
+"""
+import os
+import sys
+import time
+import random
+import resource
+import argparse
+import multiprocessing
+import numpy as np
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PAGES = ('SingleCalc.py', 'MultiCalc.py')
+
+
+def session(page: str, steps: int, seed: int, today: str | None = None, timeout: float = 60) -> dict:
+    """Runs one session of a page and returns its measurements.
+
+    Each step either switches the beam type (when the page has a selector) or sets one of the
+    number inputs to a random value around its current one, then reruns the page.
+    today = ISO date the calcs are checked against (see formulas.check_validity), default the real date
+    """
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    if today is not None:
+        _date(today)
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    baseline = _peak_rss()
+    at = AppTest.from_file(os.path.join(ROOT, page), default_timeout=timeout)
+    latencies, cpu, errors = [], [], 0
+    for step in range(steps + 1):
+        if step > 0:
+            _act(at, rng)
+        wall, clock = time.perf_counter(), time.process_time()
+        at.run()
+        latencies.append(time.perf_counter() - wall)
+        cpu.append(time.process_time() - clock)
+        errors += len(at.exception)
+    return {
+        'page': page,
+        'reruns': len(latencies),
+        'latency': latencies,
+        'cpu': cpu,
+        'errors': errors,
+        'peak_mb': _peak_rss() / 1024,
+        # Above the interpreter and Streamlit itself, loaded before the session started
+        'growth_mb': (_peak_rss() - baseline) / 1024,
+    }
+
+
+def _act(at, rng):
+    """Applies one random user action to the page, for the next rerun."""
+    selectors = [s for s in at.selectbox if s.label == 'Beam Types']
+    inputs = list(at.number_input)
+    if selectors and (rng.random() < 0.3 or selectors[0].value is None or not inputs):
+        selectors[0].select(rng.choice(selectors[0].options))
+    elif inputs:
+        widget = rng.choice(inputs)
+        value = widget.value * rng.uniform(0.5, 1.5)
+        if widget.proto.has_min:
+            value = max(value, widget.proto.min)
+        if widget.proto.has_max:
+            value = min(value, widget.proto.max)
+        widget.set_value(type(widget.value)(value))
+
+
+def _peak_rss() -> int:
+    """Returns the peak resident memory of this process, in kB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _date(today: str):
+    """Runs the calcs as of the date 'today', so expired calcs can still be load tested."""
+    import formulas
+    from datetime import datetime
+
+    class _Today(datetime):
+        @classmethod
+        def today(cls):
+            return datetime.fromisoformat(today)
+
+    formulas.datetime = _Today
+
+
+def run(pages, sessions: int, concurrency: int, steps: int, today: str | None = None, seed: int = 0) -> list:
+    """Runs the sessions, 'concurrency' at a time, and prints the per-session and overall results."""
+    # A fresh process per session, so peak memory and CPU time are the session's own
+    ctx = multiprocessing.get_context('spawn')
+    start = time.perf_counter()
+    with ctx.Pool(concurrency, maxtasksperchild=1) as pool:
+        jobs = [(pages[i % len(pages)], steps, seed + i, today) for i in range(sessions)]
+        results = pool.starmap(session, jobs)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Session':<8}{'Page':<16}{'Reruns':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'CPU s':>8}{'Peak MB':>9}{'Growth MB':>11}{'Errors':>7}")
+    for i, r in enumerate(results):
+        ms = np.array(r['latency'][1:] or r['latency']) * 1000
+        print(
+            f"{i:<8}{r['page']:<16}{r['reruns']:>7}{np.percentile(ms, 50):>9.0f}{np.percentile(ms, 95):>9.0f}"
+            f"{np.percentile(ms, 99):>9.0f}{sum(r['cpu']):>8.2f}{r['peak_mb']:>9.0f}{r['growth_mb']:>11.0f}{r['errors']:>7}"
+        )
+    print()
+    for page in pages:
+        _results = [r for r in results if r['page'] == page]
+        if not _results:
+            continue
+        # The first run of a session imports and compiles, later reruns are what users wait on
+        first = np.array([r['latency'][0] for r in _results]) * 1000
+        ms = np.concatenate([r['latency'][1:] for r in _results]) * 1000
+        cpu = np.concatenate([r['cpu'][1:] for r in _results]) * 1000
+        peak = np.array([r['peak_mb'] for r in _results])
+        print(f'{page}')
+        print(f'  First run   p50 {np.percentile(first, 50):.0f} ms | max {first.max():.0f} ms')
+        if len(ms):
+            print(f'  Rerun       p50 {np.percentile(ms, 50):.0f} ms | p95 {np.percentile(ms, 95):.0f} ms | p99 {np.percentile(ms, 99):.0f} ms | max {ms.max():.0f} ms')
+            print(f'  CPU/rerun   mean {cpu.mean():.0f} ms | p95 {np.percentile(cpu, 95):.0f} ms')
+        print(f'  Peak memory mean {peak.mean():.0f} MB | max {peak.max():.0f} MB per session')
+        print(f"  Errors      {sum(r['errors'] for r in _results)}")
+    reruns = sum(r['reruns'] for r in results)
+    print(f'\n{sessions} sessions, {reruns} reruns in {elapsed:.1f} s ({reruns / elapsed:.1f} reruns/s at concurrency {concurrency})')
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', nargs='+', default=list(PAGES), choices=PAGES)
+    parser.add_argument('--sessions', type=int, default=8)
+    parser.add_argument('--concurrency', type=int, default=os.cpu_count())
+    parser.add_argument('--steps', type=int, default=10, help='user actions (reruns) per session')
+    parser.add_argument('--today', default=None, help='ISO date the calcs are checked against, to test expired calcs')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    run(args.pages, args.sessions, args.concurrency, args.steps, args.today, args.seed)
@@ -1,34 +1,207 @@
+import functools
 import streamlit as st
 import pandas as pd
 import units
 import altair as alt
 
 
-def plot(_title: str, _xTitle: str, _yTitle: str, _xData: list, _yData: list, _xMinor:bool=False, _yMinor:bool=False) -> alt.Chart:
+def plot(_title: str, _xTitle: str, _yTitle: str, _xData: list, _yData: list, _xMinor:bool=False, _yMinor:bool=False, _chart=None) -> alt.Chart:
     """Returns an interactive graph
 
     The plot title, axis labels, tooltips, and unit display are handled within the function  
-    The major/minor unit display of the _xData list is controlled by the _xMinor boolean.
+    The major/minor unit display of the _xData list is controlled by the _xMinor boolean.  
+    Passing the chart returned from an earlier call as _chart appends the data to that chart
+    rather than rebuilding it.
     """
+    _df = frame(_xTitle, _yTitle, _xData, _yData, _xMinor, _yMinor)
+    if _chart is not None:
+        _chart.add_rows(plot=_df)
+        return _chart
+    _spec = dict(spec(_title, _xTitle, _yTitle))
+    _spec['datasets'] = {'plot': _df}
+    return st.vega_lite_chart(_spec)
+
+
+def frame(_xTitle: str, _yTitle: str, _xData: list, _yData: list, _xMinor:bool=False, _yMinor:bool=False) -> pd.DataFrame:
+    """Returns the data of a graph, as base SI values with the display text of each point"""
+    # Lists of quantities are converted and formatted as whole arrays, not one value at a time
+    _x = units.quantity_array(_xData)
+    _y = units.quantity_array(_yData)
     _df = pd.DataFrame({
-        'X': [x.to_base_units().magnitude for x in _xData],
-        'Y': [y.to_base_units().magnitude for y in _yData]
+        'X': _x.to_base_units().magnitude,
+        'Y': _y.to_base_units().magnitude
     })
-    _df[str(_xTitle)] = [units.unitdisplay(x, _xMinor) for x in _xData]
-    _df[str(_yTitle)] = [units.unitdisplay(y, _yMinor) for y in _yData]
+    _df[str(_xTitle)] = units.unitdisplay_array(_x, _xMinor)
+    _df[str(_yTitle)] = units.unitdisplay_array(_y, _yMinor)
+    return _df
+
+
+@functools.lru_cache(maxsize=None)
+def spec(_title: str, _xTitle: str, _yTitle: str) -> dict:
+    """Returns the Vega-Lite spec of a graph without its data, built once per title and axes
+
+    The data is supplied as the named dataset 'plot'. Do not modify the returned dict, copy it.
+    """
     nearest = alt.selection_point(nearest=True, fields=['X'], on='mouseover', empty=False)
-    line = alt.Chart(_df, title=alt.Title(_title, anchor='start', orient='bottom')).mark_line().encode(
+    line = alt.Chart(title=alt.Title(_title, anchor='start', orient='bottom')).mark_line().encode(
         alt.X('X:Q').scale(zero=False).axis(labels=False, title=_xTitle),
         alt.Y('Y:Q').scale(zero=False).axis(labels=False, title=_yTitle),
         alt.Tooltip([str(_xTitle+':N'), str(_yTitle+':N')])
     )
-    selectors = alt.Chart(_df).mark_point().encode(
+    selectors = alt.Chart().mark_point().encode(
         alt.X('X:Q'),
         alt.Tooltip([str(_xTitle+':N')]),
         opacity=alt.value(0)
     ).add_params(nearest)
     points = line.mark_point().encode(opacity=alt.condition(nearest, alt.value(1), alt.value(0)))
     text = line.mark_text(align='left', dx=5, dy=-5).encode(text=alt.condition(nearest, str(_yTitle+':N'), alt.value(' ')))
-    rules = alt.Chart(_df).mark_rule(color='gray').encode(x='X:Q').transform_filter(nearest)
-    chart = alt.layer(line + selectors + points + rules + text).properties(width=800, height=300).configure_axis(grid=False)
-    st.write(chart)
+    rules = alt.Chart().mark_rule(color='gray').encode(x='X:Q').transform_filter(nearest)
+    chart = alt.layer(line + selectors + points + rules + text, data=alt.NamedData('plot')).properties(
+        width=800, height=300
+    ).configure_axis(grid=False)
+    # All layers share the one named dataset 'plot', which is what later calls append to
+    return chart.to_dict()
+
+
+def plotAll(_title: str, _xTitle: str, _xData: list, _panels: dict, _xMinor: bool = False):
+    """Returns one interactive graph of several results along the same x, stacked as linked panels
+
+    _panels = dict of panel title: (_yData, _yMinor), such as {'Deflection': (deflection, True), ...}
+    All panels are drawn from one shared dataset, with x formatted once for all of them.
+    Hovering over any panel marks the same x in every panel.
+    """
+    _x = units.quantity_array(_xData)
+    _df = pd.DataFrame({'X': _x.to_base_units().magnitude})
+    _df[str(_xTitle)] = units.unitdisplay_array(_x, _xMinor)
+    for i, (_name, (_yData, _yMinor)) in enumerate(_panels.items()):
+        _y = units.quantity_array(_yData)
+        _df[f'Y{i}'] = _y.to_base_units().magnitude
+        _df[str(_name)] = units.unitdisplay_array(_y, _yMinor)
+    _spec = dict(spec_panels(_title, _xTitle, tuple(_panels)))
+    _spec['datasets'] = {'plot': _df}
+    return st.vega_lite_chart(_spec)
+
+
+@functools.lru_cache(maxsize=None)
+def spec_panels(_title: str, _xTitle: str, _yTitles: tuple) -> dict:
+    """Returns the Vega-Lite spec of linked panels without their data, built once per title and axes
+
+    Panel i draws the column 'Yi' of the named dataset 'plot'. Do not modify the returned dict, copy it.
+    """
+    # One selection shared by every panel, so the hover rule is linked across them
+    nearest = alt.selection_point(nearest=True, fields=['X'], on='mouseover', empty=False)
+    panels = []
+    for i, _yTitle in enumerate(_yTitles):
+        line = alt.Chart().mark_line().encode(
+            alt.X('X:Q').scale(zero=False).axis(labels=False, title=_xTitle if i == len(_yTitles) - 1 else None),
+            alt.Y(f'Y{i}:Q').scale(zero=False).axis(labels=False, title=_yTitle),
+            alt.Tooltip([str(_xTitle+':N'), str(_yTitle+':N')])
+        )
+        selectors = alt.Chart().mark_point().encode(
+            alt.X('X:Q'),
+            alt.Tooltip([str(_xTitle+':N')]),
+            opacity=alt.value(0)
+        ).add_params(nearest)
+        points = line.mark_point().encode(opacity=alt.condition(nearest, alt.value(1), alt.value(0)))
+        text = line.mark_text(align='left', dx=5, dy=-5).encode(text=alt.condition(nearest, str(_yTitle+':N'), alt.value(' ')))
+        rules = alt.Chart().mark_rule(color='gray').encode(x='X:Q').transform_filter(nearest)
+        panels.append(alt.layer(line, selectors, points, rules, text).properties(width=800, height=150))
+    chart = alt.vconcat(*panels, data=alt.NamedData('plot'), spacing=5).properties(
+        title=alt.Title(_title, anchor='start', orient='bottom')
+    ).configure_axis(grid=False)
+    return chart.to_dict()
+
+
+def plotEnvelope(_title: str, _yTitle: str, _xData, _lower, _upper, _yMinor: bool = False, _chunk: int = 0, _chart=None):
+    """Returns an interactive graph of the envelope (least and greatest value) of a result along the beam
+
+    _xData = normalized positions along the beam (x/L)
+    _lower, _upper = the envelope at each position, over every case so far
+    Passing the chart returned from an earlier call as _chart appends the envelope as chunk '_chunk'
+    rather than rebuilding the chart. Only the latest chunk is drawn, so the chart follows the running envelope.
+    """
+    _lo = units.quantity_array(_lower)
+    _hi = units.quantity_array(_upper)
+    _df = pd.DataFrame({
+        'X': _xData,
+        'Lo': _lo.to_base_units().magnitude,
+        'Hi': _hi.to_base_units().magnitude,
+        'Chunk': _chunk,
+    })
+    _df['x/L'] = [f'{val:.3f}' for val in _xData]
+    _df['Min'] = units.unitdisplay_array(_lo, _yMinor)
+    _df['Max'] = units.unitdisplay_array(_hi, _yMinor)
+    if _chart is not None:
+        _chart.add_rows(plot=_df)
+        return _chart
+    _spec = dict(spec_envelope(_title, _yTitle))
+    _spec['datasets'] = {'plot': _df}
+    return st.vega_lite_chart(_spec)
+
+
+@functools.lru_cache(maxsize=None)
+def spec_envelope(_title: str, _yTitle: str) -> dict:
+    """Returns the Vega-Lite spec of an envelope without its data, built once per title and axis
+
+    Draws the columns 'Lo' and 'Hi' of the named dataset 'plot' along 'X', for the largest 'Chunk' only.
+    Do not modify the returned dict, copy it.
+    """
+    x = alt.X('X:Q').scale(domain=[0, 1]).axis(title='x/L')
+    tooltip = alt.Tooltip(['x/L:N', 'Min:N', 'Max:N'])
+    band = alt.Chart(title=alt.Title(_title, anchor='start', orient='bottom')).mark_area(opacity=0.3).encode(
+        x, alt.Y('Lo:Q').scale(zero=False).axis(labels=False, title=_yTitle), alt.Y2('Hi:Q')
+    )
+    lower = alt.Chart().mark_line().encode(x, alt.Y('Lo:Q'), tooltip)
+    upper = alt.Chart().mark_line().encode(x, alt.Y('Hi:Q'), tooltip)
+    # Appended chunks stay in the dataset, but only the latest (the running envelope) is shown
+    chart = alt.layer(band, lower, upper, data=alt.NamedData('plot')).transform_joinaggregate(
+        last='max(Chunk)'
+    ).transform_filter('datum.Chunk == datum.last').properties(
+        width=800, height=250
+    ).configure_axis(grid=False)
+    return chart.to_dict()
+
+
+def plotOverlay(_title: str, _yTitle: str, _xData, _curves: dict, _yMinor: bool = False):
+    """Returns one interactive graph of several cases of the same result, overlaid along a common x
+
+    _xData = normalized positions along the beam (x/L), shared by every case
+    _curves = dict of case label: _yData, each sampled at _xData
+    Each case is drawn in its own color from one shared dataset.
+    """
+    _frames = []
+    for _case, _yData in _curves.items():
+        _y = units.quantity_array(_yData)
+        _df = pd.DataFrame({'X': _xData, 'Y': _y.to_base_units().magnitude})
+        _df['Case'] = str(_case)
+        _df['x/L'] = [f'{val:.3f}' for val in _xData]
+        _df[str(_yTitle)] = units.unitdisplay_array(_y, _yMinor)
+        _frames.append(_df)
+    _spec = dict(spec_overlay(_title, _yTitle))
+    _spec['datasets'] = {'plot': pd.concat(_frames, ignore_index=True)}
+    return st.vega_lite_chart(_spec)
+
+
+@functools.lru_cache(maxsize=None)
+def spec_overlay(_title: str, _yTitle: str) -> dict:
+    """Returns the Vega-Lite spec of overlaid cases without their data, built once per title and axis
+
+    Draws the columns 'X' and 'Y' of the named dataset 'plot', one line per 'Case'. Do not modify the returned dict, copy it.
+    """
+    nearest = alt.selection_point(nearest=True, fields=['X'], on='mouseover', empty=False)
+    line = alt.Chart(title=alt.Title(_title, anchor='start', orient='bottom')).mark_line().encode(
+        alt.X('X:Q').scale(domain=[0, 1]).axis(title='x/L'),
+        alt.Y('Y:Q').scale(zero=False).axis(labels=False, title=_yTitle),
+        alt.Color('Case:N').legend(orient='bottom', columns=1, labelLimit=800),
+        alt.Tooltip(['Case:N', 'x/L:N', str(_yTitle+':N')])
+    )
+    selectors = alt.Chart().mark_point().encode(
+        alt.X('X:Q'),
+        opacity=alt.value(0)
+    ).add_params(nearest)
+    points = line.mark_point().encode(opacity=alt.condition(nearest, alt.value(1), alt.value(0)))
+    rules = alt.Chart().mark_rule(color='gray').encode(x='X:Q').transform_filter(nearest)
+    chart = alt.layer(line, selectors, points, rules, data=alt.NamedData('plot')).properties(
+        width=800, height=250
+    ).configure_axis(grid=False)
+    return chart.to_dict()
@@ -0,0 +1,130 @@
+import os
+import re
+import ast
+import glob
+import json
+import importlib
+from datetime import datetime
+
+
+# The index lists every registered calc without importing the modules that define them.
+# It is rebuilt from the source (parsed, not imported) whenever a module registering calcs is
+# newer than it, or such a module is added or removed. Editing any other module leaves it alone.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+INDEX = os.path.join(ROOT, 'calcs_index.json')
+
+# A calc module decorates its classes with @register(...) or @registry.register(...)
+_DECORATOR = re.compile(r'^\s*@(registry\.)?register\(', re.MULTILINE)
+
+_index = None
+_loaded = {}
+
+
+def register(name: str, category: str, expires: str, inputs: tuple):
+    """Registers a calc class with its metadata.
+
+    name = string (display name in the selector)
+    category = string (group of the calc, such as 'Cantilever')
+    expires = ISO date string (calc is disabled after this date, see formulas.check_validity)
+    inputs = tuple of input names used by the calc equations
+    The arguments must be written as literals, since the index is built by reading the source.
+    """
+    def wrap(cls):
+        cls.meta = {'name': name, 'category': category, 'expires': expires, 'inputs': tuple(inputs)}
+        return cls
+    return wrap
+
+
+def sources() -> list:
+    return sorted(glob.glob(os.path.join(ROOT, '*.py')) + glob.glob(os.path.join(ROOT, 'calcs', '*.py')))
+
+
+def calc_sources() -> dict:
+    """Returns the source of each module that registers calcs, keyed by path."""
+    found = {}
+    for path in sources():
+        with open(path) as f:
+            source = f.read()
+        if _DECORATOR.search(source):
+            found[path] = source
+    return found
+
+
+def _module(path: str) -> str:
+    return os.path.relpath(path, ROOT)[:-3].replace(os.sep, '.')
+
+
+def build(found: dict | None = None) -> list:
+    """Returns the index of registered calcs, parsed from the source and written to INDEX."""
+    entries = []
+    for path, source in (calc_sources() if found is None else found).items():
+        module = _module(path)
+        for node in ast.walk(ast.parse(source)):
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for dec in node.decorator_list:
+                if isinstance(dec, ast.Call) and getattr(dec.func, 'attr', getattr(dec.func, 'id', None)) == 'register':
+                    meta = {kw.arg: ast.literal_eval(kw.value) for kw in dec.keywords}
+                    meta['inputs'] = list(meta['inputs'])
+                    entries.append(dict(meta, module=module, cls=node.name))
+    text = json.dumps(entries, indent=2)
+    try:
+        if os.path.exists(INDEX) and open(INDEX).read() == text:
+            os.utime(INDEX)  # Unchanged, only marked as current so the tracked file is not rewritten
+        else:
+            tmp = f'{INDEX}.{os.getpid()}.tmp'
+            with open(tmp, 'w') as f:
+                f.write(text)
+            os.replace(tmp, INDEX)
+    except OSError:
+        pass  # A read-only deployment keeps using the index in memory
+    return entries
+
+
+def index() -> list:
+    """Returns the index of registered calcs, rebuilding it only when a calc module has changed."""
+    global _index
+    if _index is None:
+        found = calc_sources()
+        if os.path.exists(INDEX):
+            with open(INDEX) as f:
+                _index = json.load(f)
+            newest = max((os.path.getmtime(path) for path in found), default=0)
+            if newest > os.path.getmtime(INDEX) or {_module(path) for path in found} != {e['module'] for e in _index}:
+                _index = None
+        if _index is None:
+            _index = build(found)
+    return _index
+
+
+def names(category: str | None = None) -> list:
+    return [entry['name'] for entry in index() if category is None or entry['category'] == category]
+
+
+def entry(name: str) -> dict:
+    for _entry in index():
+        if name in (_entry['name'], _entry['cls']):
+            return _entry
+    raise KeyError(f"No calc registered as '{name}'")
+
+
+def expired(name: str) -> bool:
+    """Returns True when the calc registered as 'name' is past its 'expires' date, without importing it.
+
+    Pages check this through formulas.check_validity; services and batch tools check it here.
+    """
+    return datetime.today() > datetime.fromisoformat(entry(name)['expires'])
+
+
+def load(name: str):
+    """Returns the calc class registered as 'name' (display or class name), importing only its module."""
+    if name not in _loaded:
+        _entry = entry(name)
+        _loaded[name] = getattr(importlib.import_module(_entry['module']), _entry['cls'])
+    return _loaded[name]
+
+
+if __name__ == '__main__':
+    # Rebuild the index, for example before deploying
+    for _entry in build():
+        print(f"{_entry['category']:<12} {_entry['name']:<40} {_entry['module']}.{_entry['cls']}")
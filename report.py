@@ -0,0 +1,265 @@
+import os
+import sys
+import json
+import argparse
+import functools
+import pandas as pd
+import markupsafe
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+import registry  # registry.py: Index of the calc classes. Only the module of the selected calc is imported.
+import plot  # plot.py: The chart specs of the page, reused here for static images.
+
+
+# A calc package is one report file per case plus an 'index.html' summary, written without
+# a browser or the Streamlit server. Cases are rendered in parallel worker processes, each
+# one writing its own file as soon as it is done, so memory does not grow with the package.
+# Templates, chart specs and calc modules are loaded once per worker process and reused.
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Charts shown for each case, as on the page: (result, title), in the units its calc class declares (see minor)
+CHARTS = (
+    ('deflection', 'Beam Deflection'),
+    ('shear', 'Beam Shear'),
+    ('moment', 'Beam Moment'),
+)
+
+_HEAD = '''<meta charset="utf-8">
+{% if katex %}<link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.css">
+<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/katex.min.js"></script>
+<script defer src="https://cdn.jsdelivr.net/npm/katex@0.16.9/dist/contrib/auto-render.min.js"
+  onload="renderMathInElement(document.body, {delimiters: [{left: '$', right: '$', display: false}]})"></script>{% endif %}
+{% if embed %}<script src="https://cdn.jsdelivr.net/npm/vega@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@6"></script>{% endif %}
+<style>
+  body { font-family: sans-serif; max-width: 900px; margin: auto; }
+  table { border-collapse: collapse; }
+  td, th { padding: 2px 12px; text-align: left; border-bottom: 1px solid #ddd; }
+  .error { color: #b00; }
+  pre.math { margin: 0; font-family: "DejaVu Sans Mono", monospace; }
+</style>'''
+
+TEMPLATES = {
+    'case.html': '''<!DOCTYPE html>
+<html><head><title>{{ case }} - {{ calc }}</title>
+''' + _HEAD + '''
+</head><body>
+{{ information }}
+<h2>{{ case }}</h2>
+<p>{{ calc }}</p>
+<h3>Input</h3>
+<table>{% for name, value in inputs %}<tr><td>{{ name }}</td><td>{{ value }}</td></tr>{% endfor %}</table>
+<h3>Results</h3>
+{{ formulas }}
+<table>{% for name, value in governing %}<tr><td>Maximum {{ name }}</td><td>{{ value }}</td></tr>{% endfor %}</table>
+{% for chart in charts %}<div class="chart">{% if embed %}<div id="chart{{ loop.index }}"></div>
+<script>vegaEmbed('#chart{{ loop.index }}', {{ chart }}, {actions: false});</script>{% else %}{{ chart }}{% endif %}</div>
+{% endfor %}
+</body></html>
+''',
+    'index.html': '''<!DOCTYPE html>
+<html><head><title>{{ calc }}</title>
+''' + _HEAD + '''
+</head><body>
+<h2>{{ calc }}</h2>
+<p>{{ rows | length }} cases</p>
+<table>
+<tr><th>Case</th><th>Status</th>{% for name in results %}<th>Maximum {{ name }}</th>{% endfor %}</tr>
+{% for row in rows %}<tr><td>{% if row.file %}<a href="{{ row.file }}">{{ row.case }}</a>{% else %}{{ row.case }}{% endif %}</td>
+<td{% if row.error %} class="error"{% endif %}>{{ row.error or 'OK' }}</td>
+{% for name in results %}<td>{{ row.governing.get(name, '') }}</td>{% endfor %}</tr>
+{% endfor %}</table>
+</body></html>
+''',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def template(name: str):
+    """Returns a compiled template, compiled once per process."""
+    import jinja2
+    env = jinja2.Environment(loader=jinja2.DictLoader(TEMPLATES), autoescape=jinja2.select_autoescape(['html']))
+    return env.get_template(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _markdown(text: str) -> str:
+    """Returns markdown (including the formula tables) as HTML, with the LaTeX left for KaTeX."""
+    from markdown_it import MarkdownIt
+    return MarkdownIt('commonmark').enable('table').render(text)
+
+
+@functools.lru_cache(maxsize=None)
+def information() -> str:
+    with open(os.path.join(ROOT, 'information.md'), 'r') as f:
+        return _markdown(f.read())
+
+
+@functools.lru_cache(maxsize=None)
+def _pretty(symbol: str, expr: str, cond: str | None) -> tuple:
+    """Returns a formula and its range typeset as text by sympy, for PDF where KaTeX cannot run."""
+    import sympy as sp
+    symbols = {str(s): s for s in sp.sympify(expr).free_symbols | (sp.sympify(cond).free_symbols if cond else set())}
+    formula = sp.pretty(sp.Eq(sp.Symbol(symbol), sp.sympify(expr, locals=symbols), evaluate=False), use_unicode=True)
+    return formula, '' if cond is None else sp.pretty(sp.sympify(cond, locals=symbols), use_unicode=True)
+
+
+def formulas(equations: dict) -> str:
+    """Returns the formula table of a calc as HTML, typeset on the server (no JavaScript needed)."""
+    rows = []
+    for name, formula in equations.items():
+        for i, (expr, cond) in enumerate(formula.pieces):
+            text, _range = _pretty(formula.symbol, expr, cond)
+            rows.append(
+                f'<tr><td>{name.capitalize() if i == 0 else ""}</td>'
+                f'<td><pre class="math">{markupsafe.escape(text)}</pre></td>'
+                f'<td><pre class="math">{markupsafe.escape(_range)}</pre></td></tr>'
+            )
+    return '<table>' + ''.join(rows) + '</table>'
+
+
+def chart(title: str, x, y, minor: bool = False) -> str:
+    """Returns a chart of the page as an inline SVG image, or as a Vega-Lite spec (JSON) to embed.
+
+    The SVG is drawn with the optional 'vl-convert-python' package, without a browser.
+    When it is not installed, the spec is returned and drawn when the report is opened.
+    """
+    spec = dict(plot.spec(title, 'x', 'y'))
+    spec['datasets'] = {'plot': plot.frame('x', 'y', x, y, False, minor).to_dict('records')}
+    if _embed():
+        return json.dumps(spec)
+    import vl_convert
+    return vl_convert.vegalite_to_svg(spec)
+
+
+def _text(val) -> str:
+    """Returns a quantity as a string that units.load reads back at full precision."""
+    return val if type(val) is str else f'{val.magnitude!r} {val.units}'
+
+
+def case(calc: str, name: str, inputs: dict, out: str, fmt: str = 'html') -> dict:
+    """Writes the report of one case and returns its row of the index.
+
+    calc = name of a registered calc (display or class name)
+    inputs = dict of input strings, such as {'F': '1200 lbf', ...}
+    Errors, such as an expired calc or a missing input, are reported in the row rather than raised.
+    """
+    row = {'case': name, 'file': None, 'error': None, 'governing': {}}
+    try:
+        beam = registry.load(calc).from_inputs(**inputs)
+        x = beam.x()
+        results = {result: eq(x=x, **beam.inputs()) for result, eq in beam.equations.items()}
+        for result, y in results.items():
+            row['governing'][result.capitalize()] = str(units.unitdisplay(kernels.governing(y), minor=beam.minor[result]))
+        if fmt == 'pdf' and _embed():
+            raise ImportError("PDF reports require the 'vl-convert-python' package to draw the charts")
+        embed = fmt == 'html' and _embed()
+        page = template('case.html').render(
+            case=name,
+            calc=beam.meta['name'],
+            information=_safe(information()),
+            inputs=[(key, str(units.unitdisplay(val))) for key, val in beam.inputs().items()],
+            # A PDF is rendered without JavaScript, so its formulas are typeset here rather than by KaTeX
+            formulas=_safe(formulas(beam.equations) if fmt == 'pdf' else _markdown(beam.markdown())),
+            governing=list(row['governing'].items()),
+            charts=[_safe(chart(title, x, results[result], beam.minor[result])) for result, title in CHARTS],
+            embed=embed,
+            katex=fmt == 'html',
+        )
+        row['file'] = f'{_filename(name)}.{fmt}'
+        path = os.path.join(out, row['file'])
+        if fmt == 'pdf':
+            import weasyprint  # Optional, only needed for PDF output
+            weasyprint.HTML(string=page, base_url=out).write_pdf(path)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(page)
+    except Exception as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+    return row
+
+
+def _safe(text: str):
+    """Returns HTML that the templates insert as is, rather than escaped."""
+    return markupsafe.Markup(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _embed() -> bool:
+    """Returns True when charts are embedded as specs, since 'vl-convert-python' is not installed."""
+    try:
+        import vl_convert  # noqa: F401
+        return False
+    except ImportError:
+        return True
+
+
+def _filename(name: str) -> str:
+    return ''.join(c if c.isalnum() or c in '-_.' else '_' for c in str(name))
+
+
+def generate(calc: str, cases: dict, out: str, fmt: str = 'html', workers: int | None = None, progress=None) -> str:
+    """Writes a calc package (a report per case and 'index.html') and returns the path of the index.
+
+    calc = name of a registered calc (display or class name)
+    cases = dict of case name to its inputs, each a quantity or a string (set by .load)
+    fmt = 'html' or 'pdf' (PDF requires the optional 'weasyprint' and 'vl-convert-python' packages)
+    workers = number of worker processes (default: one per CPU)
+    progress = optional function called with (done, total) as each case is written
+    # Example
+    report.generate('CantileverEndLoad', {'B1': {'F': '1200 lbf', 'L': '25 ft', 'EI': '5.7475e9 lbf*in**2'}}, 'reports')
+    """
+    if fmt not in ('html', 'pdf'):
+        raise ValueError(f"Unsupported report format '{fmt}', use html or pdf")
+    if fmt == 'pdf':
+        # Fail before any case is run, rather than once per case
+        import weasyprint  # noqa: F401
+        import vl_convert  # noqa: F401
+    os.makedirs(out, exist_ok=True)
+    # Quantities are sent to the workers as strings, which pickle without the unit registry
+    cases = {name: {key: _text(val) for key, val in inputs.items()} for name, inputs in cases.items()}
+    rows = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(case, calc, name, inputs, out, fmt) for name, inputs in cases.items()]
+        for done, future in enumerate(as_completed(futures), 1):
+            row = future.result()
+            rows[row['case']] = row
+            if progress is not None:
+                progress(done, len(futures))
+    rows = [rows[name] for name in cases]
+    entry = registry.entry(calc)
+    path = os.path.join(out, 'index.html')
+    with open(path, 'w', encoding='utf-8') as f:
+        template('index.html').stream(
+            calc=entry['name'],
+            rows=rows,
+            results=[name.capitalize() for name in ('deflection', 'slope', 'shear', 'moment')],
+            embed=False,
+            katex=False,
+        ).dump(f)
+    return path
+
+
+def read_cases(path: str) -> dict:
+    """Returns the cases of a CSV file with a 'case' column and a column per input, such as '1200 lbf'."""
+    table = pd.read_csv(path, dtype=str).set_index('case')
+    return {name: row.dropna().to_dict() for name, row in table.iterrows()}
+
+
+if __name__ == '__main__':
+    # python report.py cases.csv --calc CantileverEndLoad --out reports
+    parser = argparse.ArgumentParser(description='Writes a calculation report per case, and an index of all cases.')
+    parser.add_argument('cases', help="CSV file with a 'case' column and a column per input")
+    parser.add_argument('--calc', required=True, help='registered calc, display or class name')
+    parser.add_argument('--out', default='reports')
+    parser.add_argument('--format', default='html', choices=('html', 'pdf'))
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+    index = generate(
+        args.calc, read_cases(args.cases), args.out, args.format, args.workers,
+        progress=lambda done, total: print(f'\r{done}/{total}', end='', file=sys.stderr)
+    )
+    print(f'\n{index}')
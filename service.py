@@ -0,0 +1,286 @@
+"""Local HTTP/JSON service for the beam calculations in 'formulas.py'
+
+Run with ```python service.py --port 8600``` and POST a case to '/calc':
+
+    {"calc": "CantileverEndLoad", "inputs": {"F": "1200 lbf", "L": "25 ft", "EI": "5.7475e9 lbf*in**2"}, "num": 100}
+
+The response holds x and each result (deflection, slope, shear, moment) in base SI units,
+along with the governing (largest magnitude) value of each. 'GET /calcs' lists the available
+calculations and their inputs.
+
+Requests arriving within a short window are coalesced into one vectorized evaluation.
+Incoming cases wait in a bounded queue; when it is full the service answers 503 so
+clients back off instead of piling up memory.
+"""
+import argparse
+import asyncio
+import functools
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import registry  # registry.py: Index of the calc classes, imported only when first requested.
+
+
+STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 410: 'Gone', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+# Dimensions of the inputs of the calcs, checked before their values are reduced to base SI
+DIMENSIONS = {
+    'F': '[force]',
+    'w': '[force] / [length]',
+    'a': '[length]',
+    'L': '[length]',
+    'EI': '[force] * [length] ** 2',
+}
+
+
+class RequestError(Exception):
+    """Raised for a malformed case, answered with a 400."""
+    status = 400
+
+
+class ExpiredError(RequestError):
+    """Raised for a calc past its 'expires' date, answered with a 410 as the pages refuse to show it."""
+    status = 410
+
+
+def parse_case(body: dict) -> tuple:
+    """Returns the (calc, num, base SI inputs) for a requested case."""
+    try:
+        entry = registry.entry(str(body.get('calc')))
+    except KeyError:
+        raise RequestError(f"Unknown calc '{body.get('calc')}'")
+    if registry.expired(entry['cls']):
+        raise ExpiredError(f"The calc '{entry['name']}' expired on {entry['expires']} and requires updating")
+    num = body.get('num', 100)
+    if type(num) is not int or not 2 <= num <= 10_000:
+        raise RequestError("'num' must be an integer between 2 and 10000")
+    values = {}
+    for name in entry['inputs']:
+        text = str(body.get('inputs', {}).get(name))
+        value = to_base(text)
+        if value is None:
+            raise RequestError(f"Missing or unreadable input '{name}'")
+        # A value in the wrong units (or a bare number) would otherwise be read as base SI
+        if value[1] != _dimensionality(DIMENSIONS[name]):
+            raise RequestError(f"Input '{name}' must be a {DIMENSIONS[name]}, got '{text}'")
+        # NaN or infinite inputs would give results that are not valid JSON
+        if not math.isfinite(value[0]):
+            raise RequestError(f"Input '{name}' must be finite, got '{text}'")
+        values[name] = value[0]
+    # Values the formulas accept but that describe no real beam
+    for name in ('L', 'EI'):
+        if name in values and values[name] <= 0:
+            raise RequestError(f"Input '{name}' must be greater than 0")
+    if 'a' in values and not 0 <= values['a'] <= values['L']:
+        raise RequestError("Input 'a' must be between 0 and L")
+    return entry['cls'], num, values
+
+
+def to_base(text: str) -> tuple | None:
+    """Returns the (base SI magnitude, dimensionality) of a string quantity such as '1200 lbf'.
+
+    Parsing through pint dominates the cost of a request, so the conversion factor
+    and dimensionality of each unit string are parsed once and reused.
+    """
+    number, _, unit = text.strip().partition(' ')
+    try:
+        factor, dimensionality = _base_factor(unit.strip())
+        return float(number) * factor, dimensionality
+    except ValueError:
+        val = units.load(text)
+        if not isinstance(val, units.ureg.Quantity):
+            return None
+        return float(val.to_base_units().magnitude), val.dimensionality
+
+
+@functools.lru_cache(maxsize=256)
+def _base_factor(unit: str) -> tuple:
+    val = units.load(f'1 {unit}')
+    if not isinstance(val, units.ureg.Quantity):
+        raise ValueError(unit)
+    return val.to_base_units().magnitude, val.dimensionality
+
+
+@functools.lru_cache(maxsize=None)
+def _dimensionality(dimension: str):
+    return units.ureg.get_dimensionality(dimension)
+
+
+def evaluate(calc: str, num: int, cases: list) -> list:
+    """Returns the results for many cases of the same calc in one vectorized evaluation."""
+    values = {name: [case[name] for case in cases] for name in cases[0]}
+    results = kernels.evaluate(registry.load(calc).equations, values, num)
+    x = results.pop('x').to_base_units().magnitude
+    out = [{'x': x[i].tolist(), 'units': {'x': 'm'}, 'max': {}} for i in range(len(cases))]
+    for name, y in results.items():
+        y = y.to_base_units()
+        unit = str(y.units)
+        governing = kernels.governing(y).magnitude
+        for i, result in enumerate(out):
+            result[name] = y.magnitude[i].tolist()
+            result['units'][name] = unit
+            result['max'][name] = float(governing[i])
+    return out
+
+
+class Service():
+    """Coalesces queued cases into batches evaluated on a worker pool"""
+
+    def __init__(self, window=0.005, max_batch=256, queue_size=1024, workers=4):
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        # Limits the batches in flight, so a slow pool backs up into the bounded queue
+        self.slots = asyncio.Semaphore(workers)
+
+    def submit(self, case: tuple) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((case, future))  # raises asyncio.QueueFull for backpressure
+        return future
+
+    async def batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Only cases of the same calc and grid size can share one evaluation
+            groups = {}
+            for (calc, num, values), future in batch:
+                groups.setdefault((calc, num), []).append((values, future))
+            for (calc, num), items in groups.items():
+                await self.slots.acquire()
+                task = loop.run_in_executor(self.pool, evaluate, calc, num, [values for values, _ in items])
+                task.add_done_callback(lambda t, items=items: self._resolve(t, items))
+
+    def _resolve(self, task, items):
+        self.slots.release()
+        for i, (_, future) in enumerate(items):
+            if future.done():
+                continue
+            if task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result()[i])
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except RequestError as e:
+                    # The rest of the stream cannot be framed, so the connection is closed after answering
+                    await write_response(writer, 400, {'error': str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self.route(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, path, body):
+        if path == '/calcs':
+            return 200, {entry['cls']: entry['inputs'] for entry in registry.index()}
+        if path != '/calc':
+            return 404, {'error': f"Unknown path '{path}'"}
+        if method != 'POST':
+            return 405, {'error': "Use POST for '/calc'"}
+        try:
+            future = self.submit(parse_case(json.loads(body)))
+        except (RequestError, ValueError, AttributeError) as e:
+            return getattr(e, 'status', 400), {'error': str(e)}
+        except asyncio.QueueFull:
+            return 503, {'error': 'Service busy, retry later'}
+        try:
+            return 200, await future
+        except Exception as e:
+            return 500, {'error': str(e)}
+
+
+async def read_request(reader) -> tuple | None:
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise RequestError('Malformed request line')
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise RequestError('Malformed Content-Length')
+    if length < 0:
+        raise RequestError('Malformed Content-Length')
+    body = await reader.readexactly(length)
+    return method, path, headers, body
+
+
+async def write_response(writer, status: int, payload: dict, keep_alive: bool = True):
+    try:
+        body = json.dumps(payload, allow_nan=False).encode()
+    except ValueError:
+        status, body = 500, json.dumps({'error': 'Results are not finite'}).encode()
+    head = (
+        f'HTTP/1.1 {status} {STATUS[status]}\r\n'
+        'Content-Type: application/json\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+    )
+    if status == 503:
+        head += 'Retry-After: 1\r\n'
+    writer.write(head.encode() + b'\r\n' + body)
+    await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8600, **kwargs):
+    service = Service(**kwargs)
+    batcher = asyncio.create_task(service.batcher())
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f'{time.strftime("%X")} Serving beam calculations on http://{host}:{port}', flush=True)
+    async with server:
+        try:
+            await server.serve_forever()
+        finally:
+            batcher.cancel()
+            service.pool.shutdown()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--window', type=float, default=0.005, help='seconds to wait while coalescing a batch')
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--queue-size', type=int, default=1024)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(serve(
+        args.host, args.port, window=args.window, max_batch=args.max_batch,
+        queue_size=args.queue_size, workers=args.workers
+    ))
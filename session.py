@@ -0,0 +1,160 @@
+import os
+import sys
+import types
+from collections import OrderedDict
+import streamlit as st
+import numpy as np
+import pandas as pd
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+
+
+# Results a session keeps between reruns are held in its Cache, within a memory budget.
+# Past the budget, the least recently used entries are first compacted (full curves are
+# dropped and only their maxima kept), then evicted, so no session can pin unbounded memory.
+BUDGET_MB = float(os.environ.get('STV_SESSION_BUDGET_MB', 32))
+
+# Objects shared by every session, never counted in a session's size
+_SHARED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def sizeof(obj, _seen=None) -> int:
+    """Returns the retained size of an object and everything it holds, in bytes.
+
+    Arrays, quantities and DataFrames are counted by their data. Objects referenced twice
+    are counted once, and modules, classes and functions are not counted.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen or isinstance(obj, _SHARED):
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        # A view holds on to the array it was taken from
+        return sys.getsizeof(obj) + (sizeof(obj.base, _seen) if obj.base is not None else 0)
+    if isinstance(obj, units.ureg.Quantity) or hasattr(obj, '_magnitude'):
+        return sys.getsizeof(obj) + sizeof(obj._magnitude, _seen)
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if hasattr(obj, 'nbytes') and hasattr(obj, 'dims'):  # xarray
+        return int(obj.nbytes)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sizeof(k, _seen) + sizeof(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sizeof(v, _seen) for v in obj)
+    elif hasattr(obj, '__dict__'):
+        size += sizeof(vars(obj), _seen)
+    return size
+
+
+class Cache():
+    """Results kept by one session, bounded by a memory budget
+
+    Entries are kept in order of use. Each entry may come with a 'compact' function returning
+    a smaller form of it (such as the maxima of its curves), applied before the entry is evicted.
+    """
+
+    def __init__(self, budget_mb: float = BUDGET_MB):
+        self.budget = budget_mb * 2**20
+        self._entries = OrderedDict()  # key: [value, compact, size]
+        self.compacted = 0
+        self.evicted = 0
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def put(self, key, value, compact=None):
+        """Keeps a value, then compacts or evicts the least recently used entries past the budget."""
+        self._entries[key] = [value, compact, sizeof(value)]
+        self._entries.move_to_end(key)
+        self._trim()
+        return value
+
+    def pop(self, key, default=None):
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def items(self):
+        return [(key, entry[0]) for key, entry in self._entries.items()]
+
+    def size(self) -> int:
+        return sum(entry[2] for entry in self._entries.values())
+
+    def usage(self) -> dict:
+        """Returns the retained size of each entry, in bytes, least recently used first."""
+        return {key: entry[2] for key, entry in self._entries.items()}
+
+    def _trim(self):
+        while self.size() > self.budget:
+            # Compacting keeps an entry's result, so it is tried before evicting anything
+            for entry in self._entries.values():
+                if entry[1] is not None:
+                    entry[0], entry[1] = entry[1](entry[0]), None
+                    entry[2] = sizeof(entry[0])
+                    self.compacted += 1
+                    break
+            else:
+                self._entries.popitem(last=False)
+                self.evicted += 1
+
+
+def cache() -> Cache:
+    """Returns the result cache of the current session."""
+    if '_cache' not in st.session_state:
+        st.session_state['_cache'] = Cache()
+    return st.session_state['_cache']
+
+
+def maxima(curves: dict) -> dict:
+    """Returns the governing value of each curve, the compact form of a case's results."""
+    return {name: kernels.governing(y) for name, y in curves.items() if name != 'x'}
+
+
+def key(beam) -> tuple:
+    """Returns the key of the current case of 'beam', its calc and inputs at full precision."""
+    return (beam.meta['name'], tuple((name, f'{val.magnitude!r} {val.units}') for name, val in beam.inputs().items()))
+
+
+def remember(beam) -> dict:
+    """Keeps the results of the current case of 'beam' in the session, and returns them.
+
+    The case is keyed by its calc and inputs, so returning to an earlier case finds it again.
+    Under the budget its curves are kept; past it, only their maxima. A case compacted to its
+    maxima has lost its curves, so they are computed again (and kept again) when it is returned to.
+    """
+    results = cache().get(key(beam))
+    if results is None or 'x' not in results:
+        x = beam.x()
+        results = {'x': x, **{name: eq(x=x, **beam.inputs()) for name, eq in beam.equations.items()}}
+        cache().put(key(beam), results, compact=maxima)
+    return results
+
+
+def retained() -> dict:
+    """Returns the retained size of each item of the session state, in bytes."""
+    return {str(key): sizeof(val) for key, val in st.session_state.items()}
+
+
+def panel():
+    """Renders the memory retained by this session, against its budget"""
+    _cache = cache()
+    sizes = retained()
+    st.caption(
+        f'Session retains {sum(sizes.values()) / 2**20:.2f} MB. '
+        f'Results cache {_cache.size() / 2**20:.2f} of {_cache.budget / 2**20:.0f} MB, {len(_cache)} cases '
+        f'({_cache.compacted} compacted to maxima, {_cache.evicted} evicted)'
+    )
+    st.dataframe(pd.DataFrame({
+        'Item': list(sizes),
+        'Retained kB': np.round(np.array(list(sizes.values()), dtype=float) / 1024, 1),
+    }), hide_index=True)
@@ -0,0 +1,138 @@
+import functools
+import streamlit as st
+import numpy as np
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+from plot import plot  # plot.py: No changes to plot.py will be accepted, unless use case is fully justified.
+
+
+class ShapeTable():
+    """Dimensionless shapes of a calc's results, tabulated once over x/L (and a/L)
+
+    Each result is its characteristic value (the calc 'scales', such as F*L**3/EI) times a
+    shape that only depends on x/L and a/L. With the shapes tabulated, a new set of inputs
+    costs only a scale and an interpolation rather than a full evaluation.
+    When the calc has a load position 'a', each row of the table is split at x = a, so the
+    jump in shear and the kink in moment fall exactly on the table and are not smeared.
+    'error' holds the largest interpolation error found against the exact formulas,
+    relative to the largest value of each shape.
+    """
+
+    def __init__(self, cls, n: int = 257, m: int = 129):
+        self.cls = cls
+        self.split = 'a' in cls.meta['inputs']
+        self.s = np.linspace(0, 1, n)
+        self.alpha = np.linspace(0, 1, m) if self.split else None
+        self.table = {name: self._exact(name, *self._grid(self.alpha, self.s)) for name in cls.equations}
+        self.error = {name: self._check(name) for name in cls.equations}
+
+    def _grid(self, alpha, s):
+        """Returns the (x/L, a/L) of each table point, rows split at x = a when the calc has a load position."""
+        if not self.split:
+            return s, None
+        alpha = alpha[:, None, None]
+        left = alpha * s
+        # Points right of the load take the value just past it, so a jump is kept
+        # (including the row with the load at the tip, where the right segment has no length)
+        right = np.maximum(alpha + (1 - alpha) * s, np.nextafter(alpha, 2))
+        xi = np.concatenate([left, right], axis=1)
+        return xi, np.broadcast_to(alpha, xi.shape)
+
+    def _exact(self, name, xi, alpha=None):
+        """Returns the exact shape, the result for unit load, length and stiffness divided by its scale."""
+        values = {arg: 1.0 for arg in self.cls.meta['inputs']}
+        if alpha is not None:
+            values['a'] = alpha
+        y = self.cls.equations[name](x=xi, **values).to_base_units().magnitude
+        return y / self.cls.scales[name](**values).to_base_units().magnitude
+
+    def _check(self, name) -> float:
+        """Returns the largest interpolation error at the midpoints of the table, relative to the shape."""
+        s = (self.s[:-1] + self.s[1:]) / 2
+        alpha = None if not self.split else (self.alpha[:-1] + self.alpha[1:]) / 2
+        xi, _alpha = self._grid(alpha, s)
+        if self.split:
+            xi, _alpha = xi[:, :, 1:], _alpha[:, :, 1:]  # skip the point just past the load
+        exact = self._exact(name, xi, _alpha)
+        error = np.max(np.abs(self.shape(name, xi, _alpha) - exact))
+        return float(error / max(np.max(np.abs(self.table[name])), 1e-300))
+
+    def shape(self, name: str, xi, alpha=None) -> np.ndarray:
+        """Returns the interpolated shape of a result at x/L (and a/L)."""
+        table = self.table[name]
+        xi = np.asarray(xi, dtype=float)
+        if not self.split:
+            return np.interp(xi, self.s, table)
+        alpha = np.broadcast_to(np.asarray(alpha, dtype=float), xi.shape)
+        right = xi > alpha
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = np.where(right, (xi - alpha) / (1 - alpha), xi / alpha)
+        s = np.nan_to_num(np.clip(s, 0, 1))
+        seg = right.astype(int)
+        # Bilinear interpolation across the a/L rows and along the segment
+        p = alpha * (len(self.alpha) - 1)
+        i = np.minimum(p.astype(int), len(self.alpha) - 2)
+        t = p - i
+        q = s * (len(self.s) - 1)
+        k = np.minimum(q.astype(int), len(self.s) - 2)
+        u = q - k
+        rows = [
+            (1 - u) * table[r, seg, k] + u * table[r, seg, k + 1]
+            for r in (i, i + 1)
+        ]
+        return (1 - t) * rows[0] + t * rows[1]
+
+    def __call__(self, name: str, values: dict, x) -> units.ureg.Quantity:
+        """Returns a result at x for the input quantities, scaled from its tabulated shape."""
+        L = values['L'].to_base_units().magnitude
+        xi = units.quantity_array(x).to_base_units().magnitude / L
+        alpha = values['a'].to_base_units().magnitude / L if self.split else None
+        scale = self.cls.scales[name](**values)
+        return (scale * self.shape(name, xi, alpha)).to(self.cls.equations[name].unit)
+
+
+@functools.lru_cache(maxsize=None)
+def table(cls) -> ShapeTable:
+    """Returns the shape table of a calc class, built once per process."""
+    return ShapeTable(cls)
+
+
+# Inputs that describe no beam at 0 (the curves are scaled by x / L and 1 / EI), so their sliders stay above it
+POSITIVE = ('L', 'EI')
+
+# Reruns only the function it decorates when one of its widgets changes
+_fragment = getattr(st, 'fragment', None) or st.experimental_fragment
+
+
+def live(beam):
+    """Renders sliders for the inputs of 'beam' with results updated from the shape table."""
+    shapes = table(type(beam))
+    inputs = beam.inputs()
+
+    @_fragment
+    def panel():
+        values = {}
+        for name, val in inputs.items():
+            if name == 'a':
+                continue
+            mag = float(val.magnitude)
+            label = f'{name} [{units.unit_symbol(str(val.units))}]'
+            # The range is taken from the size of the input, so zero and negative inputs still get a valid slider
+            top = 2 * abs(mag) or 1.0
+            if name in POSITIVE:
+                low = top / 200
+            else:
+                low = -top if mag < 0 else 0.0
+            mag = max(mag, low)
+            values[name] = units.ureg.Quantity(st.slider(label, low, top, mag, top / 200), val.units)
+        if 'a' in inputs:
+            alpha = float(np.clip(np.nan_to_num((inputs['a'] / inputs['L']).to('').magnitude), 0, 1))
+            values['a'] = st.slider('a / L', 0.0, 1.0, alpha, 0.01) * values['L']
+        x = np.linspace(0, 1, 201) * values['L']
+        for name in beam.equations:
+            plot(f'Beam {name.capitalize()}', 'x', 'y', x, shapes(name, values, x), False, beam.minor[name])
+        st.caption(
+            'Interpolation error relative to each shape: '
+            + ', '.join(f'{name} {error:.1e}' for name, error in shapes.error.items())
+        )
+
+    panel()
@@ -0,0 +1,108 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+import session  # session.py: Results kept by each session between reruns, within a memory budget.
+from plot import plotEnvelope  # plot.py: No changes to plot.py will be accepted, unless use case is fully justified.
+
+
+# Shared by every session. Chunks are short, so a small pool keeps the server responsive.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='sweep')
+
+
+def chunks(equations: dict, values: dict, param: str, cases: np.ndarray, num: int = 100, size: int = 500, ahead: int = 2):
+    """Yields the governing values and the envelope of a sweep, one chunk of cases at a time.
+
+    equations = dict of kernels.Formula (a calc class 'equations')
+    values = dict of base SI magnitudes for the fixed inputs
+    param = name of the input being swept, taking each value of 'cases' (base SI magnitudes)
+    Each chunk is a (DataFrame of governing values per case, dict of (least, greatest) value of
+    each result over the chunk's cases at each x/L, in the units of its formula).
+    Chunks are computed on a background executor, a few ahead of the one being displayed.
+    Closing the generator (the page is rerun or the user cancels) drops the pending chunks.
+    """
+    def work(start):
+        _values = dict(values)
+        _values[param] = cases[start:start + size]
+        results = kernels.evaluate(equations, _values, num)
+        df = pd.DataFrame({param: _values[param]})
+        envelope = {}
+        for name in equations:
+            df[name] = kernels.governing(results[name]).magnitude
+            envelope[name] = (results[name].magnitude.min(axis=0), results[name].magnitude.max(axis=0))
+        return df, envelope
+
+    pending = deque()
+    try:
+        for start in range(0, len(cases), size):
+            pending.append(_executor.submit(work, start))
+            if len(pending) > ahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def section(beam):
+    """Renders a sweep of one input of 'beam' over many cases, streaming the results as they are computed"""
+    st.markdown('### Sweep')
+    inputs = beam.inputs()
+    param = units.selection('Swept Input', list(inputs))
+    start = units.input('From', inputs[param] * 0.5)
+    stop = units.input('To', inputs[param] * 1.5)
+    cols = units.selectioncolumns()
+    cols[0].write('<div style="text-align:right">Cases</div>', unsafe_allow_html=True)
+    count = cols[1].number_input('Cases', min_value=2, max_value=1_000_000, value=1000, label_visibility='collapsed')
+
+    if not st.button('Run sweep'):
+        if 'sweep' in session.cache():
+            st.caption('Governing cases of the last sweep')
+            st.dataframe(session.cache().get('sweep'), hide_index=True)
+        return
+    # Pressing cancel reruns the page, which stops this run and closes the generator below
+    st.button('Cancel sweep')
+
+    unit = inputs[param].to_base_units().units
+    cases = np.linspace(start.to_base_units().magnitude, stop.to_base_units().magnitude, int(count))
+    fixed = {name: val.to_base_units().magnitude for name, val in inputs.items() if name != param}
+    # Charting every case would ship more points than the browser can show, so the charts
+    # show the running envelope of each result along the beam, over every case so far
+    xi = np.linspace(0, 1, 100)
+    envelope = {}
+    progress = st.progress(0.0, text='Running sweep')
+    table = st.empty()
+    charts = {}
+    governing = {}
+    done = 0
+    for chunk, (df, _envelope) in enumerate(chunks(beam.equations, fixed, param, cases, num=len(xi))):
+        x = units.ureg.Quantity(df[param].to_numpy(), unit)
+        for name, eq in beam.equations.items():
+            y = units.ureg.Quantity(df[name].to_numpy(), eq.unit)
+            lo, hi = _envelope[name]
+            if name in envelope:
+                lo, hi = np.minimum(envelope[name][0], lo), np.maximum(envelope[name][1], hi)
+            envelope[name] = (lo, hi)
+            charts[name] = plotEnvelope(
+                f'{name.capitalize()} Envelope', name, xi, units.ureg.Quantity(lo, eq.unit), units.ureg.Quantity(hi, eq.unit),
+                beam.minor[name], chunk, _chart=charts.get(name)
+            )
+            # Keep the running governing case of each result
+            i = np.argmax(np.abs(y.magnitude))
+            if name not in governing or abs(y[i].magnitude) > abs(governing[name][1].magnitude):
+                governing[name] = (x[i], y[i])
+        done += len(df)
+        progress.progress(done / len(cases), text=f'Running sweep: {done} of {len(cases)} cases')
+        result = pd.DataFrame({
+            'Result': [name.capitalize() for name in governing],
+            param: [str(units.unitdisplay(x)) for x, _ in governing.values()],
+            'Governing Value': [str(units.unitdisplay(y, minor=beam.minor[name])) for name, (_, y) in governing.items()],
+        })
+        table.dataframe(result, hide_index=True)
+    progress.empty()
+    session.cache().put('sweep', result)
+
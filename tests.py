@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+import formulas  # formulas.py: The calc classes checked here against textbook results.
+import elastica  # elastica.py: Large deflection of a cantilever.
+import dynamics  # dynamics.py: Natural frequencies of a cantilever.
+import loadtest  # loadtest.py: Runs the calcs as of a given date, so expired calcs can still be checked.
+
+
+# Reference values from closed form results (Gere, Lindeburg, Shigley) and published tables.
+# Run with 'python -m pytest tests.py'.
+
+F, w, a, L, EI = 5000.0, 2000.0, 3.0, 7.62, 1.65e7  # N, N/m, m, m, N*m**2
+
+
+@pytest.fixture(autouse=True)
+def valid_date():
+    # The calcs expire, but their formulas do not; check them as of a date they were valid
+    loadtest._date('2024-01-01')
+
+
+def tip(cls, values: dict) -> dict:
+    """Returns each result at the free end (x = L), in base SI magnitudes."""
+    results = kernels.evaluate(cls.equations, values, 11)
+    return {name: y.to_base_units().magnitude[..., -1] for name, y in results.items()}
+
+
+def fixed(cls, values: dict) -> dict:
+    """Returns each result at the fixed end (x = 0), in base SI magnitudes."""
+    results = kernels.evaluate(cls.equations, values, 11)
+    return {name: y.to_base_units().magnitude[..., 0] for name, y in results.items()}
+
+
+def test_end_load():
+    values = {'F': F, 'L': L, 'EI': EI}
+    end = tip(formulas.CantileverEndLoad, values)
+    assert end['deflection'] == pytest.approx(-F * L**3 / (3 * EI))
+    assert end['slope'] == pytest.approx(-F * L**2 / (2 * EI))
+    assert fixed(formulas.CantileverEndLoad, values)['moment'] == pytest.approx(-F * L)
+
+
+def test_intermediate_load():
+    values = {'F': F, 'a': a, 'L': L, 'EI': EI}
+    end = tip(formulas.CantileverIntermediateLoad, values)
+    assert end['deflection'] == pytest.approx(-F * a**2 / (6 * EI) * (3 * L - a))
+    assert end['slope'] == pytest.approx(-F * a**2 / (2 * EI))
+    assert end['shear'] == pytest.approx(0)
+    assert fixed(formulas.CantileverIntermediateLoad, values)['moment'] == pytest.approx(-F * a)
+
+
+def test_uniform_load():
+    values = {'w': w, 'L': L, 'EI': EI}
+    end = tip(formulas.CantileverUniformDistributedLoad, values)
+    assert end['deflection'] == pytest.approx(-w * L**4 / (8 * EI))
+    # The slope grows with x**2 along the beam, not x
+    assert end['slope'] == pytest.approx(-w * L**3 / (6 * EI))
+    start = fixed(formulas.CantileverUniformDistributedLoad, values)
+    assert start['shear'] == pytest.approx(w * L)
+    assert start['moment'] == pytest.approx(-w * L**2 / 2)
+
+
+@pytest.mark.parametrize('cls, inputs', [
+    (formulas.CantileverEndLoad, {'F': '1200 lbf', 'L': '25 ft', 'EI': '5.7475e9 lbf*in**2'}),
+    (formulas.CantileverIntermediateLoad, {'F': '1200 lbf', 'a': '15 ft', 'L': '25 ft', 'EI': '5.7475e9 lbf*in**2'}),
+    (formulas.CantileverUniformDistributedLoad, {'w': '180 lbf/ft', 'L': '25 ft', 'EI': '5.7475e9 lbf*in**2'}),
+])
+def test_maxima_follow_the_formulas(cls, inputs):
+    # The maxima shown on the page carry the sign of the formulas and charts (downward load, negative deflection)
+    beam = cls.from_inputs(**inputs)
+    assert beam.maxDeflection().magnitude < 0
+    assert beam.maxSlope().magnitude < 0
+    assert beam.maxShear().magnitude > 0
+    assert beam.maxMoment().magnitude < 0
+    assert beam.maxShear().units == units.ureg.Unit(cls.equations['shear'].unit)
+
+
+def test_elastica_end_load():
+    # Bisshopp and Drucker (1945), F*L**2/EI = 1: tip at 0.3017 L down and 0.9436 L along, slope 0.4614 rad
+    result = elastica.solve({'F': 1.0, 'L': 1.0, 'EI': 1.0})
+    assert result['converged']
+    assert result['deflection'].magnitude[-1] == pytest.approx(-0.3017, abs=2e-4)
+    assert result['x'].magnitude[-1] == pytest.approx(0.9436, abs=2e-4)
+    assert result['slope'].magnitude[-1] == pytest.approx(-0.4614, abs=2e-4)
+
+
+def test_elastica_small_load_is_linear():
+    values = {'F': 1.0, 'L': L, 'EI': EI}
+    result = elastica.solve(values)
+    linear = tip(formulas.CantileverEndLoad, values)
+    assert result['deflection'].magnitude[-1] == pytest.approx(linear['deflection'], rel=1e-3)
+
+
+def test_cantilever_roots():
+    # Bare cantilever, and a tip mass equal to the beam mass (Blevins, Formulas for Natural Frequency and Mode Shape)
+    assert dynamics.roots(0.0) == pytest.approx([1.87510, 4.69409, 7.85476], abs=1e-5)
+    assert dynamics.roots(1.0)[0] == pytest.approx(1.24792, abs=1e-5)
+
+
+@pytest.mark.parametrize('r, alpha', [(2.0, 0.5), (0.5, 0.25), (5.0, 0.9)])
+def test_point_mass_matches_eigh(r, alpha):
+    # The secular equation solve agrees with the full generalized eigen problem of the same mesh
+    scipy = pytest.importorskip('scipy.linalg')
+    elements = 40
+    K, M = dynamics.matrices(elements)
+    e, xi = dynamics._locate(alpha, elements)
+    n = np.zeros(K.shape[0] + 2)
+    n[2 * e:2 * e + 4] = dynamics._hermite(xi, 1 / elements)
+    expected = scipy.eigh(K, M + r * np.outer(n[2:], n[2:]), eigvals_only=True)[:3] ** 0.25
+    assert dynamics.eigen(r, alpha, elements=elements)[0] == pytest.approx(expected, rel=1e-8)
+
+
+def test_point_mass_at_tip_matches_roots():
+    assert dynamics.eigen(1.0, 1.0)[0] == pytest.approx(dynamics.roots(1.0), rel=1e-6)
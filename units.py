@@ -1,4 +1,6 @@
 import streamlit as st
+import functools
+import numpy as np
 import pandas as pd
 import pint_xarray  # accessor via Dataset.pint
 from pint import UnitRegistry
@@ -18,11 +20,13 @@ e = ureg('eulers_number')
 
 
 def unit_round(val, roundval, units):
-    return round((val.to(units)/roundval.to(units)),0)*roundval
+    """Returns val rounded to a multiple of roundval, for a single quantity or an array."""
+    return np.round(val.to(units).magnitude / roundval.to(units).magnitude) * roundval
 
 
 def unit_round_down(val, roundval, units):
-    return int(round(val.to(units).magnitude/roundval.to(units).magnitude, 0))*roundval
+    """Returns val as a whole number of roundval, for a single quantity or an array."""
+    return np.round(val.to(units).magnitude / roundval.to(units).magnitude).astype(int) * roundval
 
 
 def get_UnitRegistry():
@@ -45,6 +49,39 @@ def load(str):
         pass
 
 
+# Display units for each dimensionality, as (unit, decimals) pairs in US Customary and SI.
+# The first pair is used for minor units (in/mm), the second for major units (ft/m).
+DISPLAY = {
+    '[length]': ((('in', 3), ('mm', 3)), (('ft', 2), ('m', 3))),  # Length
+    '[temperature]': ((('degF', 3), ('degC', 3)), (('degF', 3), ('degC', 3))),  # Temperature
+    '1/[temperature]': ((('1/megadelta_degF', 6), ('1/megadelta_degC', 6)),) * 2,  # Temp Coefficient
+    '[length]**2': ((('in**2', 3), ('mm**2', 4)), (('ft**2', 4), ('m**2', 4))),  # Area
+    '[length]**4': ((('in**4', 6), ('mm**4', 0)), (('ft**4', 2), ('m**4', 1))),  # Second Moment of Area
+    '[length]/[time]': ((('ft/s', 2), ('m/s', 2)), (('mph', 3), ('kph', 3))),  # Velocity
+    '[mass]/[length]': ((('lb/in', 2), ('kg/mm', 2)), (('lb/ft', 4), ('kg/m', 4))),  # Mass / Length
+    '[length]*[mass]/[time]**2': ((('lbf', 2), ('N', 2)), (('kip', 3), ('kN', 3))),  # Force
+    '[length]**2*[mass]/[time]**2': ((('lbf*in', 2), ('N*mm', 2)), (('kip*ft', 3), ('kN*m', 3))),  # Force*Length
+    '[length]**3*[mass]/[time]**2': ((('lbf*in**2', 0), ('N*mm**2', 0)), (('kip*ft**2', 3), ('kN*m**2', 3))),  # Flexural Rigidity (EI)
+    '[mass]/[time]**2': ((('lbf/in', 2), ('N/mm', 2)), (('lbf/ft', 4), ('N/m', 4))),  # Force / Length
+    '[mass]/[length]/[time]**2': ((('lbf/in**2', 2), ('N/mm**2', 2)), (('lbf/ft**2', 4), ('N/m**2', 4))),  # Pressure
+    '[mass]/[length]**3': ((('lb/in**3', 2), ('kg/mm**3', 2)), (('lb/ft**3', 4), ('kg/m**3', 4))),  # Density
+    '[mass]': ((('lb', 3), ('kg', 3)), (('lb', 2), ('kg', 2))),  # Mass
+    '1/[time]': ((('Hz', 3),),) * 2,  # Frequency, the same in both systems
+}
+_DISPLAY = {ureg.get_dimensionality(dim): pairs for dim, pairs in DISPLAY.items()}
+_DELTA_TEMPERATURE = (('delta_degF', 3), ('delta_degC', 3))
+
+
+def display_units(val, minor=False) -> tuple | None:
+    """Returns the US Customary and SI (unit, decimals) used to display a quantity, or None if not listed."""
+    pairs = _DISPLAY.get(val.dimensionality)
+    if pairs is None:
+        return None
+    if val.dimensionality == '[temperature]' and 'delta' in str(val.units):
+        return _DELTA_TEMPERATURE
+    return pairs[0] if minor else pairs[1]
+
+
 def unitdisplay(val, minor=False):
     """Returns the quantity in both US Customary and SI base units.
 
@@ -53,164 +90,54 @@ def unitdisplay(val, minor=False):
     minor = boolean (display as major unit (ft/m) or minor unit (in/mm). default=False)
     """
     try:
-        match val.dimensionality:
-            case '[length]':  # Length
-                if minor:
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('in')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('mm')))
-                        )
-                else:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('ft')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('m')))
-                        )
-            case '[temperature]':  # Temperature
-                if 'delta' in str(val.units):
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('delta_degF')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('delta_degC')))
-                    )
-                else:
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('degF')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('degC')))
-                    )
-            case '1/[temperature]':  # Temp Coefficient
-                return (
-                    '{:.6f~P}'.format(val.to(ureg.Unit('1/megadelta_degF')))
-                    + ' | ' +
-                    '{:.6f~P}'.format(val.to(ureg.Unit('1/megadelta_degC')))
-                )
-            case '[length]**2':  # Area
-                if minor:
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('in**2')))
-                        + ' | ' +
-                        '{:.4f~P}'.format(val.to(ureg.Unit('mm**2')))
-                        )
-                else:
-                    return (
-                        '{:.4f~P}'.format(val.to(ureg.Unit('ft**2')))
-                        + ' | ' +
-                        '{:.4f~P}'.format(val.to(ureg.Unit('m**2')))
-                        )
-            case '[length]**4':  # Second Moment of Area
-                if minor:
-                    return (
-                        '{:.6f~P}'.format(val.to(ureg.Unit('in**4')))
-                        + ' | ' +
-                        '{:.0f~P}'.format(val.to(ureg.Unit('mm**4')))
-                        )
-                else:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('ft**4')))
-                        + ' | ' +
-                        '{:.1f~P}'.format(val.to(ureg.Unit('m**4')))
-                        )
-            case '[length]/[time]':  # Velocity
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('ft/s')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('m/s')))
-                        )
-                else:
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('mph')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('kph')))
-                        )
-            case '[mass]/[length]':  # Mass / Length
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('lb/in')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('kg/mm')))
-                        )
-                else:
-                    return (
-                        '{:.4f~P}'.format(val.to(ureg.Unit('lb/ft')))
-                        + ' | ' +
-                        '{:.4f~P}'.format(val.to(ureg.Unit('kg/m')))
-                        )
-            case '[length]*[mass]/[time]**2':  # Force
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('lbf')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('N')))
-                        )
-                else:
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('kip')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('kN')))
-                        )
-            case '[length]**2*[mass]/[time]**2':  # Force*Length
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('lbf*in')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('N*mm')))
-                        )
-                else:
-                    return (
-                        '{:.3f~P}'.format(val.to(ureg.Unit('kip*ft')))
-                        + ' | ' +
-                        '{:.3f~P}'.format(val.to(ureg.Unit('kN*m')))
-                        )
-            case '[mass]/[time]**2':  # Force / Length
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('lbf/in')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('N/mm')))
-                        )
-                else:
-                    return (
-                        '{:.4f~P}'.format(val.to(ureg.Unit('lbf/ft')))
-                        + ' | ' +
-                        '{:.4f~P}'.format(val.to(ureg.Unit('N/m')))
-                        )
-            case '[mass]/[length]/[time]**2':  # Pressure
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('lbf/in**2')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('N/mm**2')))
-                        )
-                else:
-                    return (
-                        '{:.4f~P}'.format(val.to(ureg.Unit('lbf/ft**2')))
-                        + ' | ' +
-                        '{:.4f~P}'.format(val.to(ureg.Unit('N/m**2')))
-                        )
-            case '[mass]/[length]**3':  # Density
-                if minor:
-                    return (
-                        '{:.2f~P}'.format(val.to(ureg.Unit('lb/in**3')))
-                        + ' | ' +
-                        '{:.2f~P}'.format(val.to(ureg.Unit('kg/mm**3')))
-                        )
-                else:
-                    return (
-                        '{:.4f~P}'.format(val.to(ureg.Unit('lb/ft**3')))
-                        + ' | ' +
-                        '{:.4f~P}'.format(val.to(ureg.Unit('kg/m**3')))
-                        )
-            case '':  # Dimensionless
-                return val
-            case _:
-                return val
+        pair = display_units(val, minor)
+        if pair is None:  # Dimensionless or not listed
+            return val
+        return ' | '.join('{:.{}f~P}'.format(val.to(ureg.Unit(unit)), decimals) for unit, decimals in pair)
     except Exception:
         return '{:}'.format(val)
 
 
+def quantity_array(vals) -> UnitRegistry.Quantity:
+    """Returns a list of quantities (or a quantity array) as a single quantity array."""
+    if isinstance(vals, ureg.Quantity):
+        return vals if np.ndim(vals.magnitude) else ureg.Quantity(np.asarray(vals.magnitude), vals.units)
+    if hasattr(vals, 'units'):  # From another registry, such as the one used by pint-xarray
+        return ureg.Quantity(np.asarray(vals.magnitude), str(vals.units))
+    return ureg.Quantity.from_list(list(vals))
+
+
+def dual(vals, minor=False) -> list:
+    """Returns a whole array of quantities in both US Customary and SI display units.
+
+    Each unit is converted once for the full array, rather than once per value.
+    Returns a list of (magnitudes, unit symbol, decimals), one entry when the
+    dimensionality has no listed display units.
+    """
+    vals = quantity_array(vals)
+    pair = display_units(vals, minor)
+    if pair is None:
+        return [(vals.magnitude, str(vals.units), 3)]
+    return [(vals.to(unit).magnitude, unit_symbol(unit), decimals) for unit, decimals in pair]
+
+
+@functools.lru_cache(maxsize=None)
+def unit_symbol(unit: str) -> str:
+    return '{:~P}'.format(ureg.Unit(unit))
+
+
+def unitdisplay_array(vals, minor=False) -> np.ndarray:
+    """Returns an array of quantities in both US Customary and SI units, as an array of strings.
+
+    Matches 'unitdisplay' for each value, formatted for the full array in one pass.
+    """
+    text = [
+        np.char.add(np.char.mod(f'%.{decimals}f', mag), ' ' + symbol)
+        for mag, symbol, decimals in dual(vals, minor)
+    ]
+    return text[0] if len(text) == 1 else np.char.add(np.char.add(text[0], ' | '), text[1])
+
+
 def availableUnits(val):
     match val.dimensionality:
         case '[length]':
@@ -230,11 +157,15 @@ def availableUnits(val):
         case '[length]*[mass]/[time]**2':
             return ('force_pound', 'N')
         case '[mass]/[time]**2':
-            return ('lbf_ft', 'lbf_in', 'newton_meter', 'newton_millimeter')
+            return ('lbf/ft', 'lbf/in', 'newton/meter', 'newton/millimeter')
         case '[mass]/[length]/[time]**2':
             return ('lbf/ft**2', 'force_pound/inch**2', 'newton/meter**2', 'newton/millimeter**2')
         case '[mass]/[length]**3':
             return ('pound/foot**3', 'lb/in**3', 'kilogram/meter**3', 'kg/millimeter**3')
+        case '[mass]':
+            return ('pound', 'kilogram')
+        case '1/[time]':
+            return ('hertz', 'kilohertz')
         case '':
             return (str(val.units), ' ')
         case _:
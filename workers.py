@@ -0,0 +1,131 @@
+import time
+import weakref
+import numpy as np
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
+import units  # units.py: No changes to units.py will be accepted, unless use case is fully justified.
+import kernels  # kernels.py: Compiled numpy kernels of the formulas.
+import registry  # registry.py: Index of the calc classes, imported only when first requested.
+
+
+# Beam cases evaluated across worker processes, without pickling the results back.
+# The parent allocates one shared memory block for all results of a call, and each worker
+# writes its slice of cases straight into it. Only the (small) inputs and the layout travel
+# through the pool, and the units of each result never leave the parent. The parent returns
+# quantities whose magnitudes are views on the block, which is freed (closed and unlinked)
+# once the last of those views is dropped.
+
+
+class Pool():
+    """Process pool evaluating the calcs in 'formulas.py' into shared memory
+
+    # Example
+    with workers.Pool() as pool:
+        results = pool.evaluate('CantileverEndLoad', {'F': np.linspace(100, 5000, 100_000), 'L': 7.62, 'EI': 1.65e7})
+    results['deflection']  # quantity array (case, num), a view on shared memory
+    """
+
+    def __init__(self, workers: int | None = None, chunk: int = 5000):
+        self.chunk = chunk
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def evaluate(self, calc: str, values: dict, num: int = 100) -> dict:
+        """Returns x and each result of a calc for many cases, like kernels.evaluate.
+
+        calc = name of a registered calc (display or class name)
+        values = dict of base SI magnitudes, each a scalar or an array over the cases
+        Results are in base SI units with the shape (case, num).
+        A calc past its 'expires' date raises, as the pages refuse to show it (see formulas.check_validity).
+        """
+        if registry.expired(calc):
+            entry = registry.entry(calc)
+            raise Exception(f"The calc '{entry['name']}' expired on {entry['expires']} and requires updating")
+        equations = registry.load(calc).equations
+        values = {name: np.asarray(val, dtype=float) for name, val in values.items()}
+        cases = int(np.broadcast(*values.values()).size)
+        values = {name: np.broadcast_to(val, (cases,)) for name, val in values.items()}
+        # Units stay in the parent, workers only see offsets into the block
+        unit = {'x': 'm', **{name: _base_unit(eq.unit) for name, eq in equations.items()}}
+        layout = {name: i * cases * num for i, name in enumerate(unit)}
+        block = _Block(len(layout) * cases * num)
+
+        futures = [
+            self._executor.submit(
+                _work, calc, {name: val[start:start + self.chunk] for name, val in values.items()},
+                num, block.name, layout, (cases, num), start
+            )
+            for start in range(0, cases, self.chunk)
+        ]
+        for future in futures:
+            future.result()
+        return {
+            name: units.ureg.Quantity(block.array[offset:offset + cases * num].reshape(cases, num), unit[name])
+            for name, offset in layout.items()
+        }
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _Block():
+    """A shared memory block of float64 values, freed when its array (and every view of it) is dropped."""
+
+    def __init__(self, size: int):
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+        self.name = self._shm.name
+        self.array = np.ndarray((size,), dtype=float, buffer=self._shm.buf)
+        # Views of the array keep it alive, so this runs only after the last view is gone
+        weakref.finalize(self.array, _free, self._shm)
+
+
+def _free(shm):
+    shm.close()
+    shm.unlink()
+
+
+def _base_unit(unit: str) -> str:
+    return str(units.ureg.Quantity(1, unit).to_base_units().units)
+
+
+def _work(calc: str, values: dict, num: int, name: str, layout: dict, shape: tuple, start: int):
+    """Evaluates a slice of cases in a worker, writing the results into the shared block."""
+    results = kernels.evaluate(registry.load(calc).equations, values, num)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        stop = start + len(next(iter(values.values())))
+        for key, offset in layout.items():
+            out = np.ndarray(shape, dtype=float, buffer=shm.buf, offset=offset * 8)
+            out[start:stop] = results[key].to_base_units().magnitude
+            del out  # The mapping can only be closed once no array uses it
+    finally:
+        shm.close()
+
+
+def _pickled(calc: str, values: dict, num: int) -> dict:
+    """Returns the results of a slice of cases to the parent the usual way, pickled (for comparison)."""
+    return kernels.evaluate(registry.load(calc).equations, values, num)
+
+
+if __name__ == '__main__':
+    # Compare returning the results through shared memory with pickling them back
+    cases, num = 200_000, 100
+    values = {'F': np.linspace(500, 5000, cases), 'L': 7.62, 'EI': 1.65e7}
+    with Pool() as pool:
+        pool.evaluate('CantileverEndLoad', {'F': values['F'][:10], 'L': 7.62, 'EI': 1.65e7})  # start the workers
+        start = time.perf_counter()
+        results = pool.evaluate('CantileverEndLoad', values, num)
+        print(f'shared memory {time.perf_counter() - start:.2f} s')
+        start = time.perf_counter()
+        futures = [
+            pool._executor.submit(_pickled, 'CantileverEndLoad', {**values, 'F': values['F'][i:i + pool.chunk]}, num)
+            for i in range(0, cases, pool.chunk)
+        ]
+        pickled = [future.result() for future in futures]
+        print(f'pickled       {time.perf_counter() - start:.2f} s')
+    print(kernels.governing(results['deflection'])[:3])